@@ -1,5 +1,5 @@
 import sys
-import os # Ajout pour la gestion des chemins
+from pathlib import Path
 from PyQt5.QtCore import Qt, QRect, QUrl, QStandardPaths
 from PyQt5.QtWidgets import QApplication, QMainWindow
 # QWebEnginePage et QWebEngineProfile sont nécessaires
@@ -10,12 +10,13 @@ class Browser(QMainWindow):
     def __init__(self, url, profile, x=100, y=100, width=800, height=600):
         super().__init__()
 
-        # Créer une page web en utilisant le profil partagé
-        # C'est cette étape qui lie la vue au profil persistant
-        self.page = QWebEnginePage(profile, self)
-
         # Créer un moteur de rendu web (Chromium)
         self.browser = QWebEngineView()
+
+        # Créer une page web en utilisant le profil partagé, avant tout setUrl,
+        # pour que la vue ne crée jamais sa page par défaut (évite un cycle création/destruction)
+        # C'est cette étape qui lie la vue au profil persistant
+        self.page = QWebEnginePage(profile, self.browser)
         self.browser.setPage(self.page) # Assigner la page à la vue
         self.browser.setUrl(QUrl(url))
         self.setCentralWidget(self.browser)
@@ -36,16 +37,20 @@ if __name__ == "__main__":
     # 1. Définir un chemin pour sauvegarder les données
     # Utiliser QStandardPaths est la meilleure pratique pour la compatibilité (Windows, macOS, Linux)
     data_path = QStandardPaths.writableLocation(QStandardPaths.AppDataLocation)
-    profile_path = os.path.join(data_path, "web_profile") # Crée un sous-dossier "web_profile"
+    profile_path = Path(data_path) / "web_profile" # Crée un sous-dossier "web_profile"
 
-    # S'assurer que le dossier existe
-    if not os.path.exists(profile_path):
-        os.makedirs(profile_path)
+    # S'assurer que le dossier existe (un seul mkdir, tolère un dossier existant)
+    profile_path.mkdir(parents=True, exist_ok=True)
 
     # 2. Obtenir le profil par défaut et lui donner le chemin de sauvegarde
     default_profile = QWebEngineProfile.defaultProfile()
-    default_profile.setPersistentStoragePath(profile_path)
-    default_profile.setCachePath(profile_path) # Important de définir aussi le cache
+    default_profile.setPersistentStoragePath(str(profile_path))
+    # Le cache HTTP est jetable : on le place dans CacheLocation, pas avec les cookies
+    cache_path = Path(QStandardPaths.writableLocation(QStandardPaths.CacheLocation)) / "web_profile"
+    cache_path.mkdir(parents=True, exist_ok=True)
+    default_profile.setCachePath(str(cache_path))
+    default_profile.setHttpCacheType(QWebEngineProfile.DiskHttpCache)
+    default_profile.setHttpCacheMaximumSize(256 * 1024 * 1024) # Limiter le cache à 256 Mo
     default_profile.setPersistentCookiesPolicy(QWebEngineProfile.AllowPersistentCookies)
 
     print(f"Les données du profil seront sauvegardées dans : {profile_path}")
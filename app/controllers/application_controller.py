@@ -1,34 +1,56 @@
-import json
+import logging
+import os
+from collections import deque
+from PyQt6.QtCore import QEventLoop, QTimer
 from PyQt6.QtWidgets import QApplication, QMessageBox, QDialog
+from app.core import json_io
 from app.core.profile_manager import WebProfileManager
 from app.core.view_manager import ViewManager
 from app.views.browser_window import BrowserWindow
 from app.views.floating_button import FloatingActionMenu
-from app.views.screen_manager_dialog import ScreenManagerDialog
 from app.views.save_layout_dialog import SaveLayoutDialog
 from app.views.save_view_dialog import SaveViewDialog
 from app.views.view_selector_bar import ViewSelectorBar
 
+log = logging.getLogger(__name__)
+
+# Resolved once; PyQt6 enum attribute access is comparatively slow
+_YES = QMessageBox.StandardButton.Yes
+_NO = QMessageBox.StandardButton.No
+_ACCEPTED = QDialog.DialogCode.Accepted
+
 class ApplicationController:
     """
     The main controller of the application.
     """
     def __init__(self, config_path, layouts_path):
         self._windows = {}
-        self._window_configs = []
+        self._visible_window_ids = set()
+        self._pending_window_configs = deque()
+        self._window_queue_timer = QTimer()
+        self._window_queue_timer.setInterval(20)  # Let the event loop paint between windows
+        self._window_queue_timer.timeout.connect(self._create_next_window)
         self._layouts_data = {}
+        self._layouts_loaded = False
+        self._last_layouts_hash = None
+        self._layout_pixel_cache = {}
 
-        self.screen_geometry = QApplication.primaryScreen().geometry()
-        print(f"Detected screen resolution: {self.screen_geometry.width()}x{self.screen_geometry.height()}")
+        screen = QApplication.primaryScreen()
+        self.screen_geometry = screen.geometry()
+        self._screen_wh = (self.screen_geometry.width(), self.screen_geometry.height())
+        screen.geometryChanged.connect(self._on_screen_changed)
+        log.info("Detected screen resolution: %dx%d", *self._screen_wh)
 
-        self._config_path = config_path
         self._layouts_path = layouts_path
         
         self._profile_manager = WebProfileManager()
         self._shared_profile = self._profile_manager.get_profile()
         
-        # Initialize view manager
-        self._view_manager = ViewManager()
+        # Initialize view manager; it owns windows.json (config_path) and the views next to it
+        self._view_manager = ViewManager(
+            config_dir=os.path.dirname(config_path) or ".",
+            windows_config_path=config_path,
+        )
         
         # Initialize view selector bar
         self._view_selector = ViewSelectorBar(self._view_manager)
@@ -38,55 +60,54 @@ class ApplicationController:
         self._floating_menu.set_view_manager(self._view_manager)
         self._floating_menu.view_switch_requested.connect(self.switch_view)
         
-        self._screen_manager = ScreenManagerDialog()
-        self._save_layout_dialog = SaveLayoutDialog()
-        self._save_view_dialog = SaveViewDialog()
+        # The screen manager (and its module) is loaded on first open
+        self._screen_manager = None
+        # Save dialogs are built on first use and reset() for each later save
+        self._save_layout_dialog = None
+        self._save_view_dialog = None
         self._is_edit_mode = False
 
         self._setup_menu_actions()
 
-        self._screen_manager.layoutApplied.connect(self.apply_layout)
-
     def _setup_menu_actions(self):
         """Creates and connects all actions for the floating menu."""
+        # Edit mode actions
+        self._actions_edit = (
+            ("\u2630", self.open_screen_manager),    # Menu icon
+            ("\u21BB", self.reload_all_pages),       # Reload icon
+            ("\u2713", self.save_current_view),      # Save icon (checkmark) - now saves view
+            ("\u270E", self.toggle_edit_mode),       # Edit icon (toggle back to normal)
+            ("Q", self.quit_application)             # Quit
+        )
+        # Normal mode actions
+        self._actions_normal = (
+            ("\ud83d\udcca", self._floating_menu.show_view_menu),  # View selector (chart icon)
+            ("\u2630", self.open_screen_manager),    # Menu icon
+            ("\u21BB", self.reload_all_pages),       # Reload icon
+            ("\u270E", self.toggle_edit_mode),       # Edit icon
+            ("Q", self.quit_application)             # Quit
+        )
         self._update_menu_actions()
 
     def _update_menu_actions(self):
         """Updates menu actions based on current mode."""
-        if self._is_edit_mode:
-            # Edit mode actions
-            actions = [
-                ("\u2630", self.open_screen_manager),    # Menu icon
-                ("\u21BB", self.reload_all_pages),       # Reload icon
-                ("\u2713", self.save_current_view),      # Save icon (checkmark) - now saves view
-                ("\u270E", self.toggle_edit_mode),       # Edit icon (toggle back to normal)
-                ("Q", self.quit_application)             # Quit
-            ]
-        else:
-            # Normal mode actions
-            actions = [
-                ("\ud83d\udcca", self._floating_menu.show_view_menu),  # View selector (chart icon)
-                ("\u2630", self.open_screen_manager),    # Menu icon
-                ("\u21BB", self.reload_all_pages),       # Reload icon
-                ("\u270E", self.toggle_edit_mode),       # Edit icon
-                ("Q", self.quit_application)             # Quit
-            ]
-        
-        self._floating_menu.update_actions(actions)
-        
+        self._floating_menu.update_actions(
+            self._actions_edit if self._is_edit_mode else self._actions_normal
+        )
 
     def run(self):
         """Shows the view selector bar instead of loading windows immediately."""
-        # Load configs for later use
-        self._load_configs()
-        
-        # Show only the view selector bar on startup
+        # Show only the view selector bar on startup; windows.json is already being
+        # read in the background by the ViewManager, layouts are loaded on first use
         self._view_selector.show_centered()
-        print("View selector shown - waiting for user selection...")
+
+        # Finish configuring the web profile once the event loop is running
+        QTimer.singleShot(0, self._profile_manager.finish_initialization)
+        log.debug("View selector shown - waiting for user selection...")
 
     def _on_view_selected(self, view_id):
         """Handle view selection from the view selector bar."""
-        print(f"User selected view: {view_id}")
+        log.debug("User selected view: %s", view_id)
         
         # Switch to the selected view
         self.switch_view(view_id)
@@ -98,23 +119,22 @@ class ApplicationController:
         # Update menu actions
         self._update_menu_actions()
 
-    # --- THIS METHOD WAS MISSING ---
-    def _load_configs(self):
-        """Loads window and layout configurations from JSON files."""
+    def _ensure_layouts_loaded(self):
+        """Loads layout configurations the first time they are needed."""
+        if self._layouts_loaded:
+            return
+        self._layouts_loaded = True
+        self._layout_pixel_cache.clear()
         try:
-            with open(self._config_path, 'r') as f:
-                self._window_configs = json.load(f)
-            with open(self._layouts_path, 'r') as f:
-                self._layouts_data = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading configuration: {e}")
-            self._window_configs = []
+            self._layouts_data = json_io.read_json_cached(self._layouts_path)
+        except (OSError, json_io.JSONDecodeError) as e:
+            log.error("Error loading layouts: %s", e)
             self._layouts_data = {}
 
     def toggle_edit_mode(self):
         """Toggles drag-and-resize mode for all windows."""
         self._is_edit_mode = not self._is_edit_mode
-        print(f"Toggling Edit Mode to: {self._is_edit_mode}")
+        log.debug("Toggling Edit Mode to: %s", self._is_edit_mode)
         
         # Update menu actions based on new mode
         self._update_menu_actions()
@@ -127,148 +147,198 @@ class ApplicationController:
     
     def switch_view(self, view_id):
         """Switch to a specific view."""
-        print(f"[Controller] Switching to view: {view_id}")
+        log.debug("Switching to view: %s", view_id)
+        
+        # Re-selecting the active view would tear down and reload every window
+        if view_id == self._view_manager.get_current_view_id() and self._windows:
+            log.debug("View %s is already active", view_id)
+            return
         
         if self._view_manager.switch_view(view_id):
             # Apply the view to the current controller
             self._view_manager.apply_view_to_controller(self)
-            print(f"[Controller] Successfully switched to view: {view_id}")
+            log.debug("Successfully switched to view: %s", view_id)
         else:
-            print(f"[Controller] Failed to switch to view: {view_id}")
+            log.warning("Failed to switch to view: %s", view_id)
     
     def close_all_windows(self):
         """Close all browser windows."""
+        self._pending_window_configs.clear()
+        self._window_queue_timer.stop()
         for window in self._windows.values():
             window.close()
         self._windows.clear()
+        self._visible_window_ids.clear()
     
+    def _on_screen_changed(self, rect):
+        """Tracks resolution changes of the primary screen."""
+        self.screen_geometry = rect
+        self._screen_wh = (rect.width(), rect.height())
+        self._layout_pixel_cache.clear()
+        log.info("Screen resolution changed: %dx%d", *self._screen_wh)
+
     def get_screen_size(self):
         """Get screen dimensions for view calculations."""
-        return self.screen_geometry.width(), self.screen_geometry.height()
+        return self._screen_wh
 
     # --- THIS METHOD WAS ALSO MISSING ---
     def create_window_from_config(self, config):
+        """
+        Queues a browser window for creation. Windows are built one per timer
+        tick so each renderer start-up does not block the next paint.
+        """
+        self._pending_window_configs.append(config)
+        if not self._window_queue_timer.isActive():
+            self._window_queue_timer.start()
+            QTimer.singleShot(0, self._create_next_window)
+
+    def _create_next_window(self):
+        """Creates the next queued window, stopping the timer when the queue is empty."""
+        if not self._pending_window_configs:
+            self._window_queue_timer.stop()
+            return
+        self._build_window(self._pending_window_configs.popleft())
+        if not self._pending_window_configs:
+            self._window_queue_timer.stop()
+
+    def _flush_window_queue(self):
+        """Builds every still-queued window now, for actions that must see all of them."""
+        self._window_queue_timer.stop()
+        while self._pending_window_configs:
+            self._build_window(self._pending_window_configs.popleft())
+
+    def _build_window(self, config):
         """Creates and shows a single browser window."""
         window_id = config.get("id")
         if not window_id:
             return
 
         geo = config.get("geometry", {})
+        self._profile_manager.finish_initialization()  # No-op once the deferred pass ran
         window = BrowserWindow(profile=self._shared_profile)
+        window.visibility_changed.connect(self._on_window_visibility_changed)
         window.load_url(config.get("url", "about:blank"), window_id=window_id)
         window.set_geometry(
             geo.get("x", 100), geo.get("y", 100),
             geo.get("width", 800), geo.get("height", 600)
         )
+        if "zoom" in config:
+            window.set_zoom_level(config["zoom"])
         window.show()
+        # Edit mode may have been toggled while this window was still queued
+        if self._is_edit_mode:
+            window.set_edit_mode(True)
         self._windows[window_id] = window
 
+    def _on_window_visibility_changed(self, window_id, visible):
+        """Keeps the set of visible window ids in sync with show/hide events."""
+        if visible:
+            self._visible_window_ids.add(window_id)
+        else:
+            self._visible_window_ids.discard(window_id)
+
+    def _visible_windows(self):
+        """Returns the currently visible windows keyed by window id."""
+        return {window_id: self._windows[window_id]
+                for window_id in self._visible_window_ids if window_id in self._windows}
+
     # --- SLOTS for menu actions ---
     
     def open_screen_manager(self):
         """Opens the screen manager dialog."""
-        print("Opening Screen Manager...")
+        log.debug("Opening Screen Manager...")
         self._floating_menu.toggle_menu()
-        self._screen_manager.load_data(self._layouts_data, self._window_configs)
-        self._screen_manager.exec()
+        self._ensure_layouts_loaded()
+        screen_manager = self._screen_manager
+        if screen_manager is None:
+            from app.views.screen_manager_dialog import ScreenManagerDialog
+            screen_manager = self._screen_manager = ScreenManagerDialog()
+            screen_manager.layoutApplied.connect(self.apply_layout)
+        screen_manager.load_data(self._layouts_data, self._view_manager.get_window_configs())
+        screen_manager.exec()
 
     def reload_all_pages(self):
         """Reloads the web content of every open browser window."""
-        print("Reloading all pages...")
+        log.debug("Reloading all pages...")
         for window in self._windows.values():
             window.browser.reload()
         self._floating_menu.toggle_menu()
 
     def quit_application(self):
         """Closes the entire application."""
-        print("Quitting application...")
+        log.info("Quitting application...")
         QApplication.instance().quit()
 
+    @staticmethod
+    def _notify_later(message_box, title, text):
+        """
+        Shows a message box once control is back in the event loop, so it does
+        not open on the stack of a modal dialog that is just returning.
+        """
+        QTimer.singleShot(0, lambda: message_box(None, title, text))
+
+    def _normalized_geometries(self, visible_windows):
+        """
+        Yields (window_id, window, geometry) for each window, with geometry
+        normalized to the 0.0-1.0 screen range.
+        """
+        screen_w, screen_h = self._screen_wh
+
+        for window_id, window in visible_windows.items():
+            x, y, width, height = window.geometry().getRect()
+            yield window_id, window, {
+                "x": x / screen_w,  # No clamping - preserve off-screen positions
+                "y": y / screen_h,  # No clamping - preserve off-screen positions
+                "width": max(0.05, min(2.0, width / screen_w)),   # Allow up to 2x screen width
+                "height": max(0.05, min(2.0, height / screen_h))  # Allow up to 2x screen height
+            }
+
+    @staticmethod
+    def _to_slot(window_id, window, geometry):
+        """Builds a layout slot entry for a window and its normalized geometry."""
+        return {
+            "id": f"Slot for {window_id}",
+            "geometry": geometry,
+            "zoom": window.get_zoom_level() if hasattr(window, 'get_zoom_level') else 100
+        }
+
     def save_current_layout(self):
         """Saves the current window positions as a new layout."""
         self._floating_menu.toggle_menu()
         
         # Check if there are any visible windows to save
-        visible_windows = {window_id: window for window_id, window in self._windows.items() if window.isVisible()}
-        if not visible_windows:
+        if not self._visible_window_ids:
             QMessageBox.warning(None, "No Windows", "There are no visible windows to save as a layout.")
             return
             
         # Show the save dialog
-        if self._save_layout_dialog.exec() == QDialog.DialogCode.Accepted:
-            layout_name, layout_description = self._save_layout_dialog.get_layout_info()
-            
-            # Check if layout name already exists
-            if layout_name in self._layouts_data:
-                reply = QMessageBox.question(
-                    None,
-                    "Layout Exists",
-                    f"A layout named '{layout_name}' already exists. Do you want to overwrite it?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                    QMessageBox.StandardButton.No,
-                )
-                if reply != QMessageBox.StandardButton.Yes:
-                    return
-            
-            # Create the new layout data
-            new_layout = {
-                "description": layout_description or f"Custom layout: {layout_name}",
-                "slots": []
-            }
-            
-            # Get screen dimensions for normalization
-            screen_w = self.screen_geometry.width()
-            screen_h = self.screen_geometry.height()
-            
-            # Capture current window positions
-            for window_id, window in visible_windows.items():
-                geometry = window.geometry()
-                
-                # Normalize coordinates to 0.0-1.0 range
-                normalized_x = geometry.x() / screen_w
-                normalized_y = geometry.y() / screen_h
-                normalized_width = geometry.width() / screen_w
-                normalized_height = geometry.height() / screen_h
-                
-                # Create slot data - allow off-screen positioning
-                slot_data = {
-                    "id": f"Slot for {window_id}",
-                    "geometry": {
-                        "x": normalized_x,  # No clamping - preserve off-screen positions
-                        "y": normalized_y,  # No clamping - preserve off-screen positions
-                        "width": max(0.05, min(2.0, normalized_width)),   # Allow up to 2x screen width
-                        "height": max(0.05, min(2.0, normalized_height))  # Allow up to 2x screen height
-                    },
-                    "zoom": window.get_zoom_level() if hasattr(window, 'get_zoom_level') else 100
-                }
-                new_layout["slots"].append(slot_data)
-            
-            # Add the new layout to our data
-            self._layouts_data[layout_name] = new_layout
-            
-            # Save to file
-            try:
-                with open(self._layouts_path, 'w') as f:
-                    json.dump(self._layouts_data, f, indent=2)
-                QMessageBox.information(None, "Layout Saved", f"Layout '{layout_name}' has been saved successfully!")
-                print(f"Saved layout '{layout_name}' with {len(new_layout['slots'])} slots")
-            except Exception as e:
-                QMessageBox.critical(None, "Save Error", f"Failed to save layout: {str(e)}")
-                print(f"Error saving layout: {e}")
+        dialog = self._save_layout_dialog
+        if dialog is None:
+            dialog = self._save_layout_dialog = SaveLayoutDialog()
+        else:
+            dialog.reset()
+        if dialog.exec() == _ACCEPTED:
+            layout_name, layout_description = dialog.get_layout_info()
+            self._store_layout(layout_name, layout_description, self._visible_windows())
     
     def save_current_view(self):
         """Saves the current window arrangement as either a view or layout."""
         self._floating_menu.toggle_menu()
         
         # Check if there are any visible windows to save
-        visible_windows = {window_id: window for window_id, window in self._windows.items() if window.isVisible()}
-        if not visible_windows:
+        if not self._visible_window_ids:
             QMessageBox.warning(None, "No Windows", "There are no visible windows to save.")
             return
             
         # Show the save view dialog
-        if self._save_view_dialog.exec() == QDialog.DialogCode.Accepted:
-            save_data = self._save_view_dialog.get_save_data()
+        dialog = self._save_view_dialog
+        if dialog is None:
+            dialog = self._save_view_dialog = SaveViewDialog()
+        else:
+            dialog.reset()
+        if dialog.exec() == _ACCEPTED:
+            save_data = dialog.get_save_data()
+            visible_windows = self._visible_windows()
             
             if save_data["type"] == "view":
                 self._save_as_view(save_data, visible_windows)
@@ -280,73 +350,52 @@ class ApplicationController:
         view_id = save_data["name"].lower().replace(" ", "_")
         
         # Check if view already exists
-        if self._view_manager.get_view(view_id):
+        view_exists = self._view_manager.get_view(view_id) is not None
+        if view_exists:
             reply = QMessageBox.question(
                 None,
                 "View Exists",
                 f"A view named '{save_data['name']}' already exists. Do you want to overwrite it?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No,
+                _YES | _NO,
+                _NO,
             )
-            if reply != QMessageBox.StandardButton.Yes:
+            if reply != _YES:
                 return
         
-        # Get screen dimensions for normalization
-        screen_w = self.screen_geometry.width()
-        screen_h = self.screen_geometry.height()
-        
         # Create window definitions with positions and IDs
         windows = []
-        for window_id, window in visible_windows.items():
-            geometry = window.geometry()
-            
-            # Normalize coordinates to 0.0-1.0 range
-            normalized_x = geometry.x() / screen_w
-            normalized_y = geometry.y() / screen_h
-            normalized_width = geometry.width() / screen_w
-            normalized_height = geometry.height() / screen_h
-            
+        for window_id, window, geometry in self._normalized_geometries(visible_windows):
             window_def = {
                 "id": window_id,
-                "position": {
-                    "x": normalized_x,  # No clamping - preserve off-screen positions
-                    "y": normalized_y,  # No clamping - preserve off-screen positions
-                    "width": max(0.05, min(2.0, normalized_width)),   # Allow up to 2x screen width
-                    "height": max(0.05, min(2.0, normalized_height))  # Allow up to 2x screen height
-                },
+                "position": geometry,
                 "zoom": window.get_zoom_level() if hasattr(window, 'get_zoom_level') else 100
             }
-            print(f"[Save] Window {window_id} - Zoom: {window_def['zoom']}%")
-            
-            # Debug: Print zoom level being saved
-            zoom_level = window.get_zoom_level() if hasattr(window, 'get_zoom_level') else 100
-            print(f"[DEBUG] Saving window {window_id} with zoom level: {zoom_level}")
+            log.debug("Saving window %s with zoom level: %s%%", window_id, window_def['zoom'])
             windows.append(window_def)
         
-        # Create or update the view
-        success = self._view_manager.create_view(
+        # Create or update the view - exactly one of them, never both
+        save_view = self._view_manager.update_view if view_exists else self._view_manager.create_view
+        success = save_view(
             view_id=view_id,
             name=save_data["name"],
             description=save_data["description"] or f"Custom view: {save_data['name']}",
             layout=view_id,  # Use view_id as layout name
             windows=windows
-        ) or self._view_manager.update_view(
-            view_id=view_id,
-            name=save_data["name"],
-            description=save_data["description"] or f"Custom view: {save_data['name']}",
-            layout=view_id,
-            windows=windows
         )
         
         if success:
-            QMessageBox.information(None, "View Saved", f"View '{save_data['name']}' has been saved successfully!")
-            print(f"Saved view '{save_data['name']}' with {len(windows)} windows")
+            self._notify_later(QMessageBox.information, "View Saved", f"View '{save_data['name']}' has been saved successfully!")
+            log.info("Saved view '%s' with %d windows", save_data['name'], len(windows))
         else:
-            QMessageBox.critical(None, "Save Error", "Failed to save view.")
+            self._notify_later(QMessageBox.critical, "Save Error", "Failed to save view.")
     
     def _save_as_layout_from_view_dialog(self, save_data, visible_windows):
         """Save current arrangement as a layout (from view dialog)."""
-        layout_name = save_data["name"]
+        self._store_layout(save_data["name"], save_data["description"], visible_windows)
+
+    def _store_layout(self, layout_name, layout_description, visible_windows):
+        """Captures the visible windows as a named layout and writes it to disk."""
+        self._ensure_layouts_loaded()
         
         # Check if layout name already exists
         if layout_name in self._layouts_data:
@@ -354,57 +403,47 @@ class ApplicationController:
                 None,
                 "Layout Exists",
                 f"A layout named '{layout_name}' already exists. Do you want to overwrite it?",
-                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-                QMessageBox.StandardButton.No,
+                _YES | _NO,
+                _NO,
             )
-            if reply != QMessageBox.StandardButton.Yes:
+            if reply != _YES:
                 return
         
-        # Create the new layout data
+        # Create the new layout data from the current window positions
         new_layout = {
-            "description": save_data["description"] or f"Custom layout: {layout_name}",
-            "slots": []
+            "description": layout_description or f"Custom layout: {layout_name}",
+            "slots": [
+                self._to_slot(window_id, window, geometry)
+                for window_id, window, geometry in self._normalized_geometries(visible_windows)
+            ]
         }
         
-        # Get screen dimensions for normalization
-        screen_w = self.screen_geometry.width()
-        screen_h = self.screen_geometry.height()
-        
-        # Capture current window positions
-        for window_id, window in visible_windows.items():
-            geometry = window.geometry()
-            
-            # Normalize coordinates to 0.0-1.0 range
-            normalized_x = geometry.x() / screen_w
-            normalized_y = geometry.y() / screen_h
-            normalized_width = geometry.width() / screen_w
-            normalized_height = geometry.height() / screen_h
-            
-            # Create slot data - allow off-screen positioning
-            slot_data = {
-                "id": f"Slot for {window_id}",
-                "geometry": {
-                    "x": normalized_x,  # No clamping - preserve off-screen positions
-                    "y": normalized_y,  # No clamping - preserve off-screen positions
-                    "width": max(0.05, min(2.0, normalized_width)),   # Allow up to 2x screen width
-                    "height": max(0.05, min(2.0, normalized_height))  # Allow up to 2x screen height
-                },
-                "zoom": window.get_zoom_level() if hasattr(window, 'get_zoom_level') else 100
-            }
-            new_layout["slots"].append(slot_data)
-        
         # Add the new layout to our data
         self._layouts_data[layout_name] = new_layout
+        self._invalidate_layout_pixels(layout_name)
         
         # Save to file
         try:
-            with open(self._layouts_path, 'w') as f:
-                json.dump(self._layouts_data, f, indent=2)
-            QMessageBox.information(None, "Layout Saved", f"Layout '{layout_name}' has been saved successfully!")
-            print(f"Saved layout '{layout_name}' with {len(new_layout['slots'])} slots")
+            self._write_layouts()
+            self._notify_later(QMessageBox.information, "Layout Saved", f"Layout '{layout_name}' has been saved successfully!")
+            log.info("Saved layout '%s' with %d slots", layout_name, len(new_layout['slots']))
         except Exception as e:
-            QMessageBox.critical(None, "Save Error", f"Failed to save layout: {str(e)}")
-            print(f"Error saving layout: {e}")
+            self._notify_later(QMessageBox.critical, "Save Error", f"Failed to save layout: {str(e)}")
+            log.error("Error saving layout: %s", e)
+
+    def _write_layouts(self):
+        """
+        Writes the layouts file atomically, skipping the write when the
+        serialized content is identical to the last one written.
+        """
+        digest = json_io.write_json_if_changed(
+            self._layouts_path, self._layouts_data, self._last_layouts_hash
+        )
+        if digest == self._last_layouts_hash:
+            return
+        self._last_layouts_hash = digest
+        # Keep the parsed sidecar in step so the next start skips parsing
+        json_io.write_cache(self._layouts_path, self._layouts_data)
 
     def apply_layout(self, layout_name, assignments):
         """
@@ -414,44 +453,79 @@ class ApplicationController:
         if self._is_edit_mode:
             self.toggle_edit_mode()
 
-        print(f"Applying layout '{layout_name}' with assignments: {assignments}")
+        log.debug("Applying layout '%s' with assignments: %s", layout_name, assignments)
+        self._ensure_layouts_loaded()
         layout_info = self._layouts_data.get(layout_name)
         if not layout_info:
             return
 
-        for window in self._windows.values():
-            window.hide()
+        # Windows still waiting in the staggered creation queue must be placed too
+        self._flush_window_queue()
+        windows = tuple(self._windows.values())
+        for window in windows:
+            window.setUpdatesEnabled(False)
 
-        assigned_pages = set(assignments.values())
-        
-        # Get screen dimensions
-        screen_w = self.screen_geometry.width()
-        screen_h = self.screen_geometry.height()
+        try:
+            self._reconfigure_windows(layout_name, layout_info, assignments)
+        finally:
+            for window in windows:
+                window.setUpdatesEnabled(True)
+                window.update()
+            # Flush the queued window-system messages in one go
+            QApplication.processEvents(QEventLoop.ProcessEventsFlag.ExcludeUserInputEvents)
 
-        for slot in layout_info.get("slots", []):
-            slot_id = slot["id"]
-            page_id = assignments.get(slot_id)
-            
-            if page_id and page_id in self._windows:
-                window_to_configure = self._windows[page_id]
-                
-                # --- Calculate geometry from percentages ---
-                geo = slot["geometry"]
-                pixel_x = int(geo["x"] * screen_w)
-                pixel_y = int(geo["y"] * screen_h)
-                pixel_w = int(geo["width"] * screen_w)
-                pixel_h = int(geo["height"] * screen_h)
-                
-                window_to_configure.set_geometry(
-                    pixel_x, pixel_y, pixel_w, pixel_h
+    def _layout_pixel_slots(self, layout_name, layout_info):
+        """
+        Returns (slot_id, (x, y, width, height), zoom) for each slot of a layout,
+        converted to pixels for the current screen. Results are cached per
+        layout and resolution.
+        """
+        screen_w, screen_h = self._screen_wh
+        key = (layout_name, screen_w, screen_h)
+        slots = self._layout_pixel_cache.get(key)
+        if slots is None:
+            slots = tuple(
+                (
+                    slot["id"],
+                    (
+                        int(slot["geometry"]["x"] * screen_w),
+                        int(slot["geometry"]["y"] * screen_h),
+                        int(slot["geometry"]["width"] * screen_w),
+                        int(slot["geometry"]["height"] * screen_h),
+                    ),
+                    slot.get("zoom"),
                 )
+                for slot in layout_info.get("slots", [])
+            )
+            self._layout_pixel_cache[key] = slots
+        return slots
+
+    def _invalidate_layout_pixels(self, layout_name):
+        """Drops cached pixel geometry for one layout, at every resolution."""
+        for key in [key for key in self._layout_pixel_cache if key[0] == layout_name]:
+            del self._layout_pixel_cache[key]
+
+    def _reconfigure_windows(self, layout_name, layout_info, assignments):
+        """Places and shows the windows assigned to slots and hides the rest."""
+        windows = self._windows
+
+        placements = []
+        for slot_id, rect, zoom in self._layout_pixel_slots(layout_name, layout_info):
+            window_to_configure = windows.get(assignments.get(slot_id))
+            if window_to_configure is not None:
+                placements.append((window_to_configure, rect, zoom))
+
+        # Only hide windows that are not about to be shown again
+        placed = {window for window, _, _ in placements}
+        for window in windows.values():
+            if window not in placed:
+                window.hide()
+
+        for window_to_configure, rect, zoom in placements:
+            window_to_configure.set_geometry(*rect)
+            
+            # Apply zoom level if saved
+            if zoom is not None and hasattr(window_to_configure, 'set_zoom_level'):
+                window_to_configure.set_zoom_level(zoom)
                 
-                # Apply zoom level if saved
-                if "zoom" in slot and hasattr(window_to_configure, 'set_zoom_level'):
-                    window_to_configure.set_zoom_level(slot["zoom"])
-                    
-                window_to_configure.show()
-        
-        for page_id, window in self._windows.items():
-            if page_id not in assigned_pages:
-                window.hide()
\ No newline at end of file
+            window_to_configure.show()
\ No newline at end of file
@@ -0,0 +1,103 @@
+"""
+JSON helpers shared by the controller and the core managers.
+
+orjson is used when it is installed; otherwise the standard library json
+module is used with matching output (UTF-8 bytes, 2-space indent).
+"""
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+log = logging.getLogger(__name__)
+
+CACHE_SUFFIX = ".cache.pkl"
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one type covers both
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data):
+    """Parses JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent=False):
+    """Serializes obj to UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def read_json(path):
+    """Reads and parses a JSON file with a single unbuffered binary read."""
+    with open(path, 'rb', buffering=0) as f:
+        return loads(f.read())
+
+
+def write_json_if_changed(path, obj, last_digest=None, indent=True):
+    """
+    Serializes obj and atomically replaces path with it (temporary file,
+    fsync, os.replace), unless the payload digest equals last_digest.
+    Returns the digest of the payload, to be passed back on the next call.
+    """
+    payload = dumps(obj, indent=indent)
+    digest = hashlib.blake2b(payload, digest_size=8).digest()
+    if digest == last_digest:
+        return digest
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(payload)
+        # Data must be on disk before the rename, or a crash can leave an empty file
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return digest
+
+
+def _signature(path):
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def write_cache(path, payload):
+    """
+    Stores parsed data in a pickle sidecar next to path, stamped with the
+    source file's current mtime and size. The sidecar is replaced atomically.
+    """
+    cache_path = path + CACHE_SUFFIX
+    tmp_path = cache_path + ".tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((_signature(path), payload), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        log.warning("Could not write JSON cache %s: %s", cache_path, e)
+
+
+def read_json_cached(path):
+    """
+    Loads a JSON file, reusing the pickled copy of the parsed data when the
+    source file has not changed since it was last parsed.
+    """
+    sig = _signature(path)
+    try:
+        with open(path + CACHE_SUFFIX, 'rb') as f:
+            cached_sig, payload = pickle.load(f)
+        if cached_sig == sig:
+            return payload
+    except Exception:
+        pass  # Missing or unreadable cache - fall back to parsing
+
+    payload = read_json(path)
+    write_cache(path, payload)
+    return payload
@@ -1,72 +1,114 @@
+import logging
 import os
-import sys
 import time
-import json
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
-import requests
-from requests_ntlm import HttpNtlmAuth
-
-from PyQt6.QtCore import QStandardPaths, QUrl, QTimer, Qt, QRect, QPoint
-from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush
+from PyQt6.QtCore import QObject, QStandardPaths, QUrl, pyqtSignal
 from PyQt6.QtNetwork import QNetworkCookie
+from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEngineSettings
+
+from app.core import json_io
+
+log = logging.getLogger(__name__)
 
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile, QWebEngineSettings
+# Project root; config/auth.json and config/proxy.json live below it
+_BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
+class _NtlmRelay(QObject):
+    """Carries NTLM worker results back to the GUI thread."""
+    finished = pyqtSignal(object)
 
 
 class WebProfileManager:
     """Singleton manager for a persistent QWebEngineProfile with auth support (callback or cookie fallback)."""
     _instance = None
 
+    __slots__ = (
+        "profile", "_profile_path", "_deferred_done",
+        "_username", "_password", "_has_creds", "_using_http_callback",
+        "_proxy_user", "_proxy_pwd",
+        "_ntlm_session", "_ntlm_executor", "_ntlm_relay",
+    )
+
     def __new__(cls):
-        if cls._instance is None:
-            print("Creating the single WebProfileManager instance.")
-            cls._instance = super(WebProfileManager, cls).__new__(cls)
-            cls._instance._initialize_profile()
-        return cls._instance
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        log.debug("Creating the single WebProfileManager instance.")
+        instance = cls._instance = super(WebProfileManager, cls).__new__(cls)
+        instance._initialize_profile()
+        return instance
 
     def _initialize_profile(self):
+        """
+        Fast path: creates the profile with its storage location, cookie policy and
+        user agent. Everything else is configured by finish_initialization().
+        """
         # PyQt6: use StandardLocation enum for writableLocation
         data_path = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
         profile_path = os.path.join(data_path, "DigitalDisplayApp_Profile")
         if not os.path.exists(profile_path):
             os.makedirs(profile_path, exist_ok=True)
             
-        print(f"Profile storage path: {profile_path}")
+        log.info("Profile storage path: %s", profile_path)
+
+        # NTLM fallback state: one persistent session, driven from one worker thread
+        self._ntlm_session = None
+        self._ntlm_executor = None
+        self._ntlm_relay = _NtlmRelay()
+        self._ntlm_relay.finished.connect(self._on_ntlm_finished)
 
         # Use a dedicated profile with explicit storage path
         self.profile = QWebEngineProfile("DigitalDisplayProfile", None)
         self.profile.setPersistentStoragePath(profile_path)
-        self.profile.setCachePath(os.path.join(profile_path, "cache"))
         self.profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.AllowPersistentCookies)
         
         # Force profile to be off-the-record = False to ensure persistence
-        print(f"Profile is off-the-record: {self.profile.isOffTheRecord()}")
+        log.debug("Profile is off-the-record: %s", self.profile.isOffTheRecord())
         
+        # Use a Chrome-like user agent to avoid enterprise proxy filtering on unknown UAs
+        ua = (
+            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/121.0.0.0 Safari/537.36"
+        )
+        self.profile.setHttpUserAgent(ua)
+
+        # Filled in by finish_initialization()
+        self._profile_path = profile_path
+        self._deferred_done = False
+        self._username, self._password = None, None
+        self._has_creds = False
+        self._using_http_callback = False
+        self._proxy_user, self._proxy_pwd = None, None
+
+    def finish_initialization(self):
+        """
+        Deferred path: cache, settings, credentials and auth handlers. Safe to call
+        repeatedly; runs once, and must run before the first page uses the profile.
+        """
+        if self._deferred_done:
+            return
+        self._deferred_done = True
+        profile_path = self._profile_path
+        self.profile.setCachePath(os.path.join(profile_path, "cache"))
+
         # Additional persistence settings
         try:
             # Enable local storage and database storage for session persistence
             settings = self.profile.settings()
             settings.setAttribute(QWebEngineSettings.WebAttribute.LocalStorageEnabled, True)
             settings.setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-            print("Enabled local storage for session persistence")
+            log.debug("Enabled local storage for session persistence")
         except Exception as e:
-            print(f"Error configuring storage settings: {e}")
+            log.warning("Error configuring storage settings: %s", e)
 
         # Credentials: prefer config/auth.json, fallback to env vars; else rely on Windows SSO.
         self._username, self._password = self._load_credentials()
         self._has_creds = bool(self._username and self._password)
 
-        # Use a Chrome-like user agent to avoid enterprise proxy filtering on unknown UAs
-        ua = (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/121.0.0.0 Safari/537.36"
-        )
-        self.profile.setHttpUserAgent(ua)
-
         # Enable performance-related settings
         try:
             settings = self.profile.settings()
@@ -88,7 +130,7 @@ class WebProfileManager:
         # First try: setHttpAuthRequestedCallback (Qt >= 5.12 / PyQt versions)
         if hasattr(self.profile, "setHttpAuthRequestedCallback") and self._has_creds:
             try:
-                print("Registering HTTP auth callback using setHttpAuthRequestedCallback(...)")
+                log.debug("Registering HTTP auth callback using setHttpAuthRequestedCallback(...)")
                 # The callback signature differs by bindings; accept variable args and try to set credentials.
                 def _http_auth_callback(*args):
                     # args might be (request_url, auth) or (request_url, auth, authenticator) depending on Qt/PyQt
@@ -100,26 +142,26 @@ class WebProfileManager:
                             if hasattr(a, "setUser") and hasattr(a, "setPassword"):
                                 a.setUser(self._username)
                                 a.setPassword(self._password)
-                                print("HTTP auth callback: provided credentials via authenticator object.")
+                                log.debug("HTTP auth callback: provided credentials via authenticator object.")
                                 return
                         # Sometimes a tuple (host, realm, auth) etc - fallback to printing
-                        print("HTTP auth callback invoked but no authenticator object found in args:", args)
+                        log.warning("HTTP auth callback invoked but no authenticator object found in args: %s", args)
                     except Exception as e:
-                        print("Error in http auth callback:", e)
+                        log.error("Error in http auth callback: %s", e)
 
                 self.profile.setHttpAuthRequestedCallback(_http_auth_callback)
                 self._using_http_callback = True
             except Exception as e:
-                print("Failed to register setHttpAuthRequestedCallback:", e)
+                log.warning("Failed to register setHttpAuthRequestedCallback: %s", e)
                 self._using_http_callback = False
         else:
             if not hasattr(self.profile, "setHttpAuthRequestedCallback"):
-                print("Profile has no setHttpAuthRequestedCallback API.")
+                log.debug("Profile has no setHttpAuthRequestedCallback API.")
             else:
-                print("No explicit credentials provided; relying on Windows SSO (Chromium allowlist).")
+                log.debug("No explicit credentials provided; relying on Windows SSO (Chromium allowlist).")
             self._using_http_callback = False
 
-        print(f"Web profile storage location: {profile_path}")
+        log.debug("Web profile storage location: %s", profile_path)
         
         # Proxy auth handling (some enterprises require NTLM/Kerberos on the proxy)
         try:
@@ -132,12 +174,12 @@ class WebProfileManager:
                         if user and pwd and hasattr(authenticator, "setUser"):
                             authenticator.setUser(user)
                             authenticator.setPassword(pwd)
-                            print(f"[proxy] Provided credentials for proxy {proxy_host}")
+                            log.debug("[proxy] Provided credentials for proxy %s", proxy_host)
                     except Exception as e:
-                        print("[proxy] Error supplying proxy credentials:", e)
+                        log.error("[proxy] Error supplying proxy credentials: %s", e)
                 self.profile.proxyAuthenticationRequired.connect(_on_proxy_auth)
         except Exception as e:
-            print("[proxy] Failed to attach proxy auth handler:", e)
+            log.warning("[proxy] Failed to attach proxy auth handler: %s", e)
 
     def get_profile(self):
         return self.profile
@@ -147,27 +189,28 @@ class WebProfileManager:
         Returns a tuple (username, password) or (None, None) if not available.
         """
         try:
-            base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-            auth_path = os.path.join(base_dir, "config", "auth.json")
-            if os.path.exists(auth_path):
-                with open(auth_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+            auth_path = os.path.join(_BASE_DIR, "config", "auth.json")
+            try:
+                data = json_io.read_json(auth_path)
+            except FileNotFoundError:
+                data = None
+            if data:
                 user = data.get("username") or data.get("user")
                 pwd = data.get("password") or data.get("pass") or data.get("pwd")
                 if user and pwd:
-                    print("Loaded credentials from config/auth.json")
+                    log.info("Loaded credentials from config/auth.json")
                     return user, pwd
         except Exception as e:
-            print("Error reading config/auth.json:", e)
+            log.error("Error reading config/auth.json: %s", e)
 
         # Fallback to environment variables
         user = os.environ.get("IWA_USERNAME") or os.environ.get("NTLM_USERNAME")
         pwd = os.environ.get("IWA_PASSWORD") or os.environ.get("NTLM_PASSWORD")
         if user and pwd:
-            print("Loaded credentials from environment variables")
+            log.info("Loaded credentials from environment variables")
             return user, pwd
         
-        print("No explicit credentials found; relying on Windows SSO if available.")
+        log.info("No explicit credentials found; relying on Windows SSO if available.")
         return None, None
 
     def _load_proxy_credentials(self):
@@ -175,23 +218,24 @@ class WebProfileManager:
         Returns (username, password) or (None, None).
         """
         try:
-            base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
-            proxy_path = os.path.join(base_dir, "config", "proxy.json")
-            if os.path.exists(proxy_path):
-                with open(proxy_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
+            proxy_path = os.path.join(_BASE_DIR, "config", "proxy.json")
+            try:
+                data = json_io.read_json(proxy_path)
+            except FileNotFoundError:
+                data = None
+            if data:
                 user = data.get("username") or data.get("user")
                 pwd = data.get("password") or data.get("pass") or data.get("pwd")
                 if user and pwd:
-                    print("Loaded proxy credentials from config/proxy.json")
+                    log.info("Loaded proxy credentials from config/proxy.json")
                     return user, pwd
         except Exception as e:
-            print("Error reading config/proxy.json:", e)
+            log.error("Error reading config/proxy.json: %s", e)
         
         user = os.environ.get("PROXY_USERNAME")
         pwd = os.environ.get("PROXY_PASSWORD")
         if user and pwd:
-            print("Loaded proxy credentials from environment variables")
+            log.info("Loaded proxy credentials from environment variables")
             return user, pwd
         return None, None
 
@@ -199,90 +243,126 @@ class WebProfileManager:
         """Return (username, password) for NTLM/Kerberos challenges.
         Username should include domain as DOMAIN\\user if required by the server.
         """
+        self.finish_initialization()
         return self._username, self._password
 
     def has_credentials(self) -> bool:
+        self.finish_initialization()
         return self._has_creds
 
     # Fallback: NTLM via requests + cookie injection
-    def ntlm_session_and_inject(self, target_url: str):
+    def ntlm_session_and_inject(self, target_url: str, callback=None):
         """
         If HTTP callback isn't available or doesn't work, call this to perform NTLM auth with requests
         and inject cookies into the profile's cookie store.
+
+        The HTTP round trip runs on a worker thread; cookies are injected on the GUI
+        thread afterwards and callback(success) is invoked there. Returns True when
+        priming was started (or is not needed), False when it cannot run.
         """
+        self.finish_initialization()
         if getattr(self, "_using_http_callback", False):
-            print("Note: HTTP callback is enabled; cookie-injection fallback not required.")
+            log.debug("Note: HTTP callback is enabled; cookie-injection fallback not required.")
+            if callback:
+                callback(True)
             return True
         if not self._has_creds:
-            print("No explicit credentials available; skip NTLM cookie injection.")
+            log.debug("No explicit credentials available; skip NTLM cookie injection.")
+            if callback:
+                callback(False)
             return False
 
-        # 1) authenticate with requests + requests-ntlm
-        session = requests.Session()
-        user, pwd = self.get_auth_credentials()
-        session.auth = HttpNtlmAuth(user, pwd)
-
-        # Helpful headers to resemble a browser
-        session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) PyQtWebEngine/1.0",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        })
+        if self._ntlm_executor is None:
+            self._ntlm_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ntlm")
+        self._ntlm_executor.submit(self._ntlm_fetch, target_url, callback)
+        return True
 
-        print("[ntlm] Attempting NTLM-authenticated GET to:", target_url)
+    def _ntlm_fetch(self, target_url, callback):
+        """Worker thread: NTLM-authenticated GET on the shared session."""
+        cookies = None
         try:
+            session = self._get_ntlm_session()
+            log.debug("[ntlm] Attempting NTLM-authenticated GET to: %s", target_url)
             resp = session.get(target_url, timeout=30, verify=True)
             resp.raise_for_status()
-            print("[ntlm] Authenticated OK. Status:", resp.status_code)
+            log.debug("[ntlm] Authenticated OK. Status: %s", resp.status_code)
+            cookies = list(session.cookies)
         except Exception as e:
-            print("[ntlm] NTLM authentication GET failed:", e)
-            return False
+            log.warning("[ntlm] NTLM authentication GET failed: %s", e)
+        self._ntlm_relay.finished.emit((target_url, cookies, callback))
+
+    def _get_ntlm_session(self):
+        """Returns the persistent requests session, creating it on first use."""
+        if self._ntlm_session is None:
+            # requests is only needed on this fallback path; keep it off the startup import chain
+            import requests
+            from requests_ntlm import HttpNtlmAuth
+
+            # 1) authenticate with requests + requests-ntlm
+            session = requests.Session()
+            user, pwd = self.get_auth_credentials()
+            session.auth = HttpNtlmAuth(user, pwd)
+
+            # Helpful headers to resemble a browser
+            session.headers.update({
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) PyQtWebEngine/1.0",
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            })
+            self._ntlm_session = session
+        return self._ntlm_session
+
+    def _on_ntlm_finished(self, result):
+        """GUI thread: inject the worker's cookies, then notify the caller."""
+        target_url, cookies, callback = result
+        success = cookies is not None
+        if success:
+            self._inject_cookies(target_url, cookies)
+        if callback:
+            try:
+                callback(success)
+            except Exception as e:
+                log.error("[ntlm] Completion callback failed: %s", e)
 
+    def _inject_cookies(self, target_url, cookies):
         # 2) inject cookies into QWebEngineProfile cookie store
         cookie_store = self.profile.cookieStore()
         parsed = urlparse(target_url)
         base_url = f"{parsed.scheme}://{parsed.hostname}"
 
+        qurl = QUrl(base_url)
+        now = time.time()
+
         injected = 0
-        for c in session.cookies:
-            # Build a QNetworkCookie
-            qcookie = QNetworkCookie()
-            qcookie.setName(c.name.encode("utf-8"))
-            qcookie.setValue(c.value.encode("utf-8"))
-            if c.domain:
-                try:
+        for c in cookies:
+            if c.expires and c.expires < now:
+                continue
+            try:
+                # Build a QNetworkCookie
+                qcookie = QNetworkCookie(c.name.encode("utf-8"), c.value.encode("utf-8"))
+                if c.domain:
                     qcookie.setDomain(c.domain)
-                except Exception:
-                    pass
-            if c.path:
-                try:
+                if c.path:
                     qcookie.setPath(c.path)
-                except Exception:
-                    pass
-            try:
                 qcookie.setSecure(bool(c.secure))
-            except Exception:
-                pass
-
-            if c.expires and c.expires < time.time():
+                cookie_store.setCookie(qcookie, qurl)
+            except Exception as e:
+                log.warning("[cookie] Skipped %s: %s", c.name, e)
                 continue
-
-            cookie_store.setCookie(qcookie, QUrl(base_url))
             injected += 1
-            print(f"[cookie] Injected: {c.name}; domain={c.domain} path={c.path} secure={c.secure}")
+            log.debug("[cookie] Injected: %s; domain=%s path=%s secure=%s", c.name, c.domain, c.path, c.secure)
 
-        print(f"[cookie] Total injected cookies: {injected}")
-        return True
+        log.debug("[cookie] Total injected cookies: %d", injected)
 
     def ensure_session_persistence(self):
         """Force the profile to save session data immediately."""
         try:
             # The profile should automatically persist, but we can force a sync
-            print("Ensuring session data is persisted...")
+            log.debug("Ensuring session data is persisted...")
             # Access cookie store to trigger any pending saves
             cookie_store = self.profile.cookieStore()
-            print("Cookie store accessed for persistence")
+            log.debug("Cookie store accessed for persistence")
         except Exception as e:
-            print(f"Error ensuring persistence: {e}")
+            log.error("Error ensuring persistence: %s", e)
 
     def get_profile_info(self):
         """Get info about the current profile for debugging."""
@@ -294,3 +374,7 @@ class WebProfileManager:
             "user_agent": self.profile.httpUserAgent()
         }
 
+
+def get_profile_manager():
+    """Returns the shared WebProfileManager, creating it on first use."""
+    return WebProfileManager._instance or WebProfileManager()
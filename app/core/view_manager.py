@@ -7,11 +7,15 @@ A view is a combination of:
 - Metadata: View name, description, etc.
 """
 
-import json
 import os
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from PyQt6.QtCore import QObject, pyqtSignal
 
+from app.core import json_io
+
 
 class ViewManager(QObject):
     """Manages predefined views combining layouts and window configurations."""
@@ -20,24 +24,58 @@ class ViewManager(QObject):
     view_changed = pyqtSignal(str)  # Emitted when view is switched
     view_loaded = pyqtSignal(dict)  # Emitted when view is loaded
     
-    def __init__(self, config_dir: str = "config"):
+    def __init__(self, config_dir: str = "config", windows_config_path: Optional[str] = None):
         super().__init__()
         self.config_dir = config_dir
         self.views_config_path = os.path.join(config_dir, "views.json")
-        self.windows_config_path = os.path.join(config_dir, "windows.json")
+        self.windows_config_path = windows_config_path or os.path.join(config_dir, "windows.json")
         self.layouts_config_path = os.path.join(config_dir, "layouts.json")
         
         self.current_view = None
         self.views = {}
         
+        # Derived read-only data, rebuilt lazily after any change to self.views
+        self._views_proxy = None
+        self._names_cache = None
+        self._ids_cache = None
+        
+        # Write coalescing for batch_updates()
+        self._dirty = False
+        self._batch_depth = 0
+        self._last_views_digest = None
+        
+        # windows.json cache, keyed by the file's (mtime, size)
+        self._window_configs_sig = None
+        self._window_configs = []
+        self._window_map = {}
+        
+        # Read views.json and windows.json concurrently; windows.json is
+        # collected on the first get_window_configs() call, which also shuts the pool down
+        self._io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="view-io")
+        self._window_configs_future = self._io_executor.submit(self._read_window_configs)
+        self._views_future = self._io_executor.submit(self._read_views)
+        
         self._load_views()
     
+    def _read_views(self):
+        """Reads views.json, or returns None when it does not exist yet."""
+        if not os.path.exists(self.views_config_path):
+            return None
+        return json_io.read_json(self.views_config_path)
+    
+    def _read_window_configs(self):
+        """Reads windows.json (via the parsed-data sidecar), returning its (mtime, size) signature and contents."""
+        st = os.stat(self.windows_config_path)
+        return (st.st_mtime_ns, st.st_size), json_io.read_json_cached(self.windows_config_path)
+    
     def _load_views(self):
         """Load view definitions from config file."""
+        future, self._views_future = self._views_future, None
         try:
-            if os.path.exists(self.views_config_path):
-                with open(self.views_config_path, 'r', encoding='utf-8') as f:
-                    self.views = json.load(f)
+            views = future.result() if future is not None else self._read_views()
+            if views is not None:
+                self.views = views
+                self._invalidate_view_cache()
                 print(f"[ViewManager] Loaded {len(self.views)} views from {self.views_config_path}")
             else:
                 # Create default views if config doesn't exist
@@ -77,33 +115,66 @@ class ViewManager(QObject):
                 ]
             }
         }
+        self._invalidate_view_cache()
         self._save_views()
     
     def _save_views(self):
         """Save current views to config file."""
         try:
             os.makedirs(self.config_dir, exist_ok=True)
-            with open(self.views_config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.views, f, indent=2, ensure_ascii=False)
+            self._last_views_digest = json_io.write_json_if_changed(
+                self.views_config_path, self.views, self._last_views_digest
+            )
+            self._dirty = False
             print(f"[ViewManager] Saved views to {self.views_config_path}")
         except Exception as e:
             print(f"[ViewManager] Error saving views: {e}")
     
-    def get_views(self) -> Dict[str, Dict[str, Any]]:
-        """Get all available views."""
-        return self.views.copy()
+    def _mark_dirty(self):
+        """Records a change to the views, saving now unless inside batch_updates()."""
+        self._invalidate_view_cache()
+        self._dirty = True
+        if not self._batch_depth:
+            self._save_views()
+    
+    @contextmanager
+    def batch_updates(self):
+        """Coalesces the saves of several view mutations into one write on exit."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._save_views()
+    
+    def _invalidate_view_cache(self):
+        """Drops derived data after self.views was replaced or mutated."""
+        self._views_proxy = None
+        self._names_cache = None
+        self._ids_cache = None
+    
+    def get_views(self) -> Mapping[str, Dict[str, Any]]:
+        """Get all available views as a read-only mapping."""
+        if self._views_proxy is None:
+            self._views_proxy = MappingProxyType(self.views)
+        return self._views_proxy
     
     def get_view(self, view_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific view by ID."""
         return self.views.get(view_id)
     
-    def get_view_names(self) -> List[str]:
-        """Get list of view names for UI display."""
-        return [view["name"] for view in self.views.values()]
+    def get_view_names(self) -> Tuple[str, ...]:
+        """Get view names for UI display."""
+        if self._names_cache is None:
+            self._names_cache = tuple(view["name"] for view in self.views.values())
+        return self._names_cache
     
-    def get_view_ids(self) -> List[str]:
-        """Get list of view IDs."""
-        return list(self.views.keys())
+    def get_view_ids(self) -> Tuple[str, ...]:
+        """Get view IDs."""
+        if self._ids_cache is None:
+            self._ids_cache = tuple(self.views)
+        return self._ids_cache
     
     def switch_view(self, view_id: str) -> bool:
         """Switch to a specific view."""
@@ -111,6 +182,10 @@ class ViewManager(QObject):
             print(f"[ViewManager] View '{view_id}' not found")
             return False
         
+        # Already active - nothing to emit
+        if view_id == self.current_view:
+            return True
+        
         view = self.views[view_id]
         print(f"[ViewManager] Switching to view: {view['name']}")
         
@@ -143,7 +218,7 @@ class ViewManager(QObject):
             "windows": windows
         }
         
-        self._save_views()
+        self._mark_dirty()
         print(f"[ViewManager] Created new view: {name}")
         return True
     
@@ -157,7 +232,7 @@ class ViewManager(QObject):
             self.current_view = None
         
         del self.views[view_id]
-        self._save_views()
+        self._mark_dirty()
         print(f"[ViewManager] Deleted view: {view_id}")
         return True
     
@@ -171,17 +246,36 @@ class ViewManager(QObject):
             if key in ["name", "description", "layout", "windows"]:
                 self.views[view_id][key] = value
         
-        self._save_views()
+        self._mark_dirty()
         print(f"[ViewManager] Updated view: {view_id}")
         return True
     
     def get_window_configs(self) -> List[Dict]:
-        """Load window configurations from windows.json."""
+        """Load window configurations from windows.json, re-reading only when it changes."""
         try:
-            with open(self.windows_config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            future, self._window_configs_future = self._window_configs_future, None
+            if future is not None:
+                # Both startup reads are now claimed; the pool has no further work
+                self._io_executor.shutdown(wait=False)
+                self._io_executor = None
+                sig, configs = future.result()
+                self._window_map = {w['id']: w for w in configs}
+                self._window_configs = configs
+                self._window_configs_sig = sig
+            
+            st = os.stat(self.windows_config_path)
+            sig = (st.st_mtime_ns, st.st_size)
+            if sig != self._window_configs_sig:
+                configs = json_io.read_json_cached(self.windows_config_path)
+                self._window_map = {w['id']: w for w in configs}
+                self._window_configs = configs
+                self._window_configs_sig = sig
+            return self._window_configs
         except Exception as e:
             print(f"[ViewManager] Error loading windows config: {e}")
+            self._window_configs_sig = None
+            self._window_configs = []
+            self._window_map = {}
             return []
     
     def apply_view_to_controller(self, controller) -> bool:
@@ -191,44 +285,49 @@ class ViewManager(QObject):
             return False
         
         view = self.views[self.current_view]
-        window_configs = self.get_window_configs()
-        
-        # Create a mapping of window ID to config
-        window_map = {w['id']: w for w in window_configs}
+        # Mapping of window ID to config, rebuilt only when windows.json changes
+        self.get_window_configs()
+        window_map = self._window_map
         
         # Close existing windows first
         if hasattr(controller, 'close_all_windows'):
             controller.close_all_windows()
         
+        # Resolve the controller's capabilities and the screen size once per view
+        create_window = getattr(controller, 'create_window_from_config', None)
+        get_screen_size = getattr(controller, 'get_screen_size', None)
+        screen_size = get_screen_size() if get_screen_size is not None else None
+        
         # Create windows according to view
         for window_def in view['windows']:
             window_id = window_def['id']
             position = window_def['position']
             
             if window_id in window_map:
-                window_config = window_map[window_id].copy()
+                # Per-view overrides; the cached base config is never mutated
+                overrides = {}
                 
                 # Convert normalized positions to pixel coordinates
-                if hasattr(controller, 'get_screen_size'):
-                    screen_width, screen_height = controller.get_screen_size()
+                if screen_size is not None:
+                    screen_width, screen_height = screen_size
                     
-                    window_config['geometry'] = {
+                    overrides['geometry'] = {
                         'x': int(position['x'] * screen_width),
                         'y': int(position['y'] * screen_height),
                         'width': int(position['width'] * screen_width),
                         'height': int(position['height'] * screen_height)
                     }
                 
+                # Saved zoom level travels with the config; the window applies it on creation
+                if 'zoom' in window_def:
+                    overrides['zoom'] = window_def['zoom']
+                
+                base_config = window_map[window_id]
+                window_config = {**base_config, **overrides} if overrides else base_config
+                
                 # Create the window
-                if hasattr(controller, 'create_window_from_config'):
-                    controller.create_window_from_config(window_config)
-                    
-                    # Apply zoom level if saved and window was created
-                    if 'zoom' in window_def and hasattr(controller, '_windows') and window_id in controller._windows:
-                        window = controller._windows[window_id]
-                        if hasattr(window, 'set_zoom_level'):
-                            window.set_zoom_level(window_def['zoom'])
-                            print(f"[ViewManager] Applied zoom level {window_def['zoom']}% to window {window_id}")
+                if create_window is not None:
+                    create_window(window_config)
         
         print(f"[ViewManager] Applied view '{view['name']}'")
         return True
\ No newline at end of file
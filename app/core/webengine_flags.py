@@ -0,0 +1,33 @@
+"""
+Chromium command-line flags passed to QtWebEngine through
+QTWEBENGINE_CHROMIUM_FLAGS. The string is joined once at import.
+"""
+
+# Corporate domains trusted for Windows Integrated Authentication
+_AUTH_DOMAINS = "*.ocpgroup.ma,*.powerbi.com,*.microsoftonline.com,*.windows.net,*.sharepoint.com"
+
+CHROME_FLAGS = (
+    # Allow Windows Integrated Authentication for Power BI and corporate domains
+    f"--auth-server-allowlist={_AUTH_DOMAINS}",
+    f"--auth-negotiate-delegate-whitelist={_AUTH_DOMAINS}",
+    "--auth-schemes=basic,digest,ntlm,negotiate",
+    # Proxy auto-detection for corporate environments
+    "--proxy-auto-detect",
+    # Allow popups for auth flows
+    "--disable-popup-blocking",
+    # Performance flags for heavy dashboards like Power BI
+    "--ignore-gpu-blocklist",
+    "--enable-gpu-rasterization",
+    "--enable-zero-copy",
+    "--enable-accelerated-2d-canvas",
+    "--js-flags=--max-old-space-size=4096",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    # Relax cookie restrictions to help Microsoft auth flows
+    "--disable-features=SameSiteByDefaultCookies,CookiesWithoutSameSiteMustBeSecure,ThirdPartyStoragePartitioning",
+    # Additional compatibility
+    "--enable-features=NetworkService,OutOfBlinkCors",
+)
+
+CHROME_FLAGS_STR = " ".join(CHROME_FLAGS)
@@ -1,53 +1,97 @@
-from PyQt6.QtCore import Qt, QRect, QUrl, QPoint, QTimer
+import logging
+import os
+import re
+import time
+from functools import partial
+
+from PyQt6.QtCore import Qt, QEvent, QRect, QUrl, QTimer, pyqtSignal
 from PyQt6.QtWidgets import QMainWindow, QWidget, QSlider, QLabel, QHBoxLayout, QVBoxLayout
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebEngineCore import QWebEnginePage
 from PyQt6.QtGui import QPainter, QColor, QPen, QBrush
-from app.core.profile_manager import WebProfileManager
+from app.core.profile_manager import get_profile_manager
+
+log = logging.getLogger(__name__)
+
+# URL fragments that indicate a Microsoft authentication popup has completed
+_AUTH_SUCCESS_INDICATORS = (
+    'dashboard', 'authenticated', 'success', 'login_successful',
+    'app.powerbi.com/reportEmbed', 'app.powerbi.com/groups',
+    'sharepoint.com/personal', 'sharepoint.com/_layouts',
+    'office.com/login/success', 'login.microsoftonline.com/common/reprocess',
+    'powerbi.com/view', 'powerbi.com/reports'
+)
+# One case-insensitive pass over the URL instead of lower() plus a scan per fragment
+_AUTH_SUCCESS_RE = re.compile('|'.join(map(re.escape, _AUTH_SUCCESS_INDICATORS)), re.IGNORECASE)
 
 # ---------- Minimal UI classes (EditOverlay + BrowserWindow) ----------
 class EditOverlay(QWidget):
+    _ZOOM_QSS = """
+    QWidget {
+        background-color: rgba(0, 0, 0, 150);
+        border-radius: 12px;
+        padding: 2px;
+    }
+    QSlider::groove:horizontal {
+        border: 2px solid rgba(0, 122, 204, 0.8);
+        height: 4px;
+        background: rgba(255, 255, 255, 0.9);
+        margin: 2px 0;
+        border-radius: 3px;
+    }
+    QSlider::handle:horizontal {
+        background: #007ACC;
+        border: 2px solid #ffffff;
+        width: 16px;
+        height: 16px;
+        margin: -6px 0;
+        border-radius: 8px;
+        box-shadow: 0px 2px 4px rgba(0, 0, 0, 0.3);
+    }
+    QSlider::handle:horizontal:hover {
+        background: #1e90ff;
+        border: 2px solid #ffffff;
+    }
+    QSlider::handle:horizontal:pressed {
+        background: #0066cc;
+    }
+    """
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setMouseTracking(True)
+        # Only the border and handle are painted; skip the background fill
+        self.setAttribute(Qt.WidgetAttribute.WA_NoSystemBackground, True)
         self._is_resizing = False
         self._is_dragging = False
-        self._drag_start_position = QPoint()
+        self._drag_start_x = 0
+        self._drag_start_y = 0
         self._resize_margin = 16
         
+        # Paint resources are reused across repaints; the handle rect follows resizes
+        self._border_color = QColor(0, 170, 255, 200)
+        self._border_pen = QPen(self._border_color, 4)
+        self._handle_brush = QBrush(self._border_color)
+        self._update_handle_geometry()
+        self._current_cursor = None
+        
+        # Zoom controls are built on first use; the overlay usually stays hidden
+        self._zoom_widget = None
+        self._zoom_slider = None
+        
+        # Zoom is applied once the slider settles
+        self._pending_zoom = None
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(80)
+        self._zoom_timer.timeout.connect(self.apply_pending_zoom)
+
+    def _build_zoom_widget(self):
+        """Creates the zoom slider widget and parses its stylesheet."""
         # Create zoom slider widget - minimal design at bottom
         self._zoom_widget = QWidget(self)
         self._zoom_widget.setFixedSize(150, 25)
-        self._zoom_widget.setStyleSheet("""
-            QWidget {
-                background-color: rgba(0, 0, 0, 150);
-                border-radius: 12px;
-                padding: 2px;
-            }
-            QSlider::groove:horizontal {
-                border: 2px solid rgba(0, 122, 204, 0.8);
-                height: 4px;
-                background: rgba(255, 255, 255, 0.9);
-                margin: 2px 0;
-                border-radius: 3px;
-            }
-            QSlider::handle:horizontal {
-                background: #007ACC;
-                border: 2px solid #ffffff;
-                width: 16px;
-                height: 16px;
-                margin: -6px 0;
-                border-radius: 8px;
-                box-shadow: 0px 2px 4px rgba(0, 0, 0, 0.3);
-            }
-            QSlider::handle:horizontal:hover {
-                background: #1e90ff;
-                border: 2px solid #ffffff;
-            }
-            QSlider::handle:horizontal:pressed {
-                background: #0066cc;
-            }
-        """)
+        self._zoom_widget.setStyleSheet(self._ZOOM_QSS)
         
         # Setup zoom controls - only slider, no label
         layout = QHBoxLayout(self._zoom_widget)
@@ -56,110 +100,173 @@ class EditOverlay(QWidget):
         
         self._zoom_slider = QSlider(Qt.Orientation.Horizontal)
         self._zoom_slider.setRange(25, 300)  # 25% to 300% zoom
-        self._zoom_slider.setValue(100)
+        browser = getattr(self.parent(), 'browser', None)
+        self._zoom_slider.setValue(int(browser.zoomFactor() * 100) if browser is not None else 100)
         
         layout.addWidget(self._zoom_slider)
         
-        # Connect zoom slider
+        # Connect zoom slider; web view paints are held while the handle is dragged
         self._zoom_slider.valueChanged.connect(self._on_zoom_changed)
+        self._zoom_slider.sliderPressed.connect(self._on_zoom_slider_pressed)
+        self._zoom_slider.sliderReleased.connect(self._on_zoom_slider_released)
         
         # Initially hide zoom widget
         self._zoom_widget.hide()
 
     def _on_zoom_changed(self, value):
-        """Handle zoom slider changes."""
+        """Handle zoom slider changes by (re)starting the zoom throttle."""
+        self._pending_zoom = value
+        self._zoom_timer.start()
+
+    def _on_zoom_slider_pressed(self):
+        browser = getattr(self.parent(), 'browser', None)
+        if browser is not None:
+            browser.setUpdatesEnabled(False)
+
+    def _on_zoom_slider_released(self):
+        browser = getattr(self.parent(), 'browser', None)
+        if browser is not None:
+            self.apply_pending_zoom()
+            browser.setUpdatesEnabled(True)
+            browser.update()
+
+    def apply_pending_zoom(self):
+        """Applies the latest slider value to the parent browser window, if any is pending."""
+        self._zoom_timer.stop()
+        value, self._pending_zoom = self._pending_zoom, None
+        if value is None:
+            return
         zoom_factor = value / 100.0
         
         # Apply zoom to the parent browser window
         if hasattr(self.parent(), 'browser'):
             self.parent().browser.setZoomFactor(zoom_factor)
-            print(f"[DEBUG] Zoom changed to {value}% (factor: {zoom_factor}) for window")
+            log.debug("Zoom changed to %d%% (factor: %s) for window", value, zoom_factor)
 
     def show_zoom_controls(self):
         """Show the zoom slider widget."""
+        if self._zoom_widget is None:
+            self._build_zoom_widget()
         self._zoom_widget.show()
         self._position_zoom_widget()
 
     def hide_zoom_controls(self):
         """Hide the zoom slider widget."""
-        self._zoom_widget.hide()
+        if self._zoom_widget is not None:
+            self._zoom_widget.hide()
+
+    def sync_zoom_slider(self, zoom_percentage):
+        """Moves the slider to an externally applied zoom level without re-applying it."""
+        if self._zoom_slider is not None:
+            self._zoom_slider.blockSignals(True)
+            self._zoom_slider.setValue(zoom_percentage)
+            self._zoom_slider.blockSignals(False)
 
     def _position_zoom_widget(self):
         """Position zoom widget at bottom-center of overlay."""
         if self.width() > 0 and self.height() > 0:
             x = (self.width() - self._zoom_widget.width()) // 2
             y = self.height() - self._zoom_widget.height() - 15  # 15px from bottom
-            self._zoom_widget.move(x, y)
+            pos = self._zoom_widget.pos()
+            if pos.x() != x or pos.y() != y:
+                self._zoom_widget.move(x, y)
 
     def resizeEvent(self, event):
         """Reposition zoom widget when overlay is resized."""
         super().resizeEvent(event)
-        if self._zoom_widget.isVisible():
+        if event.size() == event.oldSize():
+            return
+        self._update_handle_geometry()
+        if self._zoom_widget is not None and self._zoom_widget.isVisible():
             self._position_zoom_widget()
 
     def paintEvent(self, event):
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        border_color = QColor(0, 170, 255, 200)
-        pen = QPen(border_color, 4)
-        painter.setPen(pen)
-        painter.drawRect(self.rect().adjusted(2, 2, -2, -2))
-        handle_rect = self.get_resize_handle_rect()
+        painter.setPen(self._border_pen)
+        painter.drawRect(self._border_rect)
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QBrush(border_color))
-        painter.drawRect(handle_rect)
+        painter.setBrush(self._handle_brush)
+        painter.drawRect(self._handle_rect)
 
     def get_resize_handle_rect(self):
+        return self._handle_rect
+
+    def _compute_resize_handle_rect(self):
         return QRect(self.width() - self._resize_margin,
                      self.height() - self._resize_margin,
                      self._resize_margin,
                      self._resize_margin)
 
+    def _update_handle_geometry(self):
+        """Recomputes the cached border/handle rects and the handle's top-left corner."""
+        self._handle_rect = self._compute_resize_handle_rect()
+        self._handle_x0 = self._handle_rect.x()
+        self._handle_y0 = self._handle_rect.y()
+        self._border_rect = self.rect().adjusted(2, 2, -2, -2)
+
+    def _in_resize_handle(self, event):
+        # The handle sits in the bottom-right corner, and mouse events only
+        # arrive inside the overlay, so the top-left bound is the whole test
+        pos = event.position()
+        return pos.x() >= self._handle_x0 and pos.y() >= self._handle_y0
+
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
-            self._drag_start_position = event.globalPosition().toPoint()
-            if self.get_resize_handle_rect().contains(event.pos()):
+            gp = event.globalPosition()
+            self._drag_start_x, self._drag_start_y = int(gp.x()), int(gp.y())
+            if self._in_resize_handle(event):
                 self._is_resizing = True
             else:
                 self._is_dragging = True
             event.accept()
 
+    def _set_cursor_shape(self, shape):
+        """Changes the cursor only when the shape actually differs."""
+        if shape != self._current_cursor:
+            self.setCursor(shape)
+            self._current_cursor = shape
+
     def mouseMoveEvent(self, event):
-        if self.get_resize_handle_rect().contains(event.pos()):
-            self.setCursor(Qt.CursorShape.SizeFDiagCursor)
-        else:
-            self.setCursor(Qt.CursorShape.SizeAllCursor)
+        if not (self._is_dragging or self._is_resizing):
+            # Hovering: only the cursor shape can change
+            if self._in_resize_handle(event):
+                self._set_cursor_shape(Qt.CursorShape.SizeFDiagCursor)
+            else:
+                self._set_cursor_shape(Qt.CursorShape.SizeAllCursor)
+            return
 
         if event.buttons() == Qt.MouseButton.LeftButton:
-            delta = event.globalPosition().toPoint() - self._drag_start_position
+            gp = event.globalPosition()
+            x, y = int(gp.x()), int(gp.y())
+            dx = x - self._drag_start_x
+            dy = y - self._drag_start_y
+            self._drag_start_x, self._drag_start_y = x, y
             parent = self.parent()
             if self._is_dragging:
-                parent.move(parent.pos() + delta)
-                self._drag_start_position = event.globalPosition().toPoint()
+                parent.move(parent.x() + dx, parent.y() + dy)
             elif self._is_resizing:
-                new_width = parent.width() + delta.x()
-                new_height = parent.height() + delta.y()
+                new_width = parent.width() + dx
+                new_height = parent.height() + dy
                 parent.resize(max(200, new_width), max(200, new_height))
-                self._drag_start_position = event.globalPosition().toPoint()
             event.accept()
 
     def mouseReleaseEvent(self, event):
         self._is_dragging = False
         self._is_resizing = False
-        self.setCursor(Qt.CursorShape.ArrowCursor)
+        self._set_cursor_shape(Qt.CursorShape.ArrowCursor)
         event.accept()
 
 
 class CustomWebEnginePage(QWebEnginePage):
-    def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
-        try:
-            print(f"JS Console ({sourceID}:{lineNumber}): {message}")
-        except Exception:
-            pass
+    # Relaying the page's console costs a Python upcall per message, so the
+    # override only exists in APP_DEBUG runs; otherwise the base class drops them
+    if os.environ.get("APP_DEBUG"):
+        def javaScriptConsoleMessage(self, level, message, lineNumber, sourceID):
+            log.debug("JS Console (%s:%s): %s", sourceID, lineNumber, message)
 
     def createWindow(self, _type):
         """Handle popup window requests - create a simple popup that works."""
-        print(f"Pop-up window requested (type: {_type}). Creating popup...")
+        log.debug("Pop-up window requested (type: %s). Creating popup...", _type)
         try:
             # Import here to avoid circular imports
             from PyQt6.QtWidgets import QDialog, QVBoxLayout
@@ -182,61 +289,92 @@ class CustomWebEnginePage(QWebEnginePage):
             new_page = CustomWebEnginePage(self.profile(), popup_browser)
             popup_browser.setPage(new_page)
             
-            # Store reference to prevent garbage collection
+            # Store reference to prevent garbage collection until the dialog closes
             if not hasattr(self, '_popup_refs'):
-                self._popup_refs = []
-            self._popup_refs.append((popup_dialog, popup_browser, new_page))
+                self._popup_refs = {}
+            popup_key = id(popup_dialog)
+            self._popup_refs[popup_key] = (popup_dialog, popup_browser, new_page)
+            popup_dialog.finished.connect(partial(self._release_popup, popup_key))
             
             # Connect signals
-            def on_load_finished(success):
-                print(f"Popup load finished: {success}")
-                
-            def on_url_changed(url):
-                url_str = url.toString()
-                print(f"Popup URL: {url_str}")
-                
-                # Check for various Microsoft authentication success indicators
-                success_indicators = [
-                    'dashboard', 'authenticated', 'success', 'login_successful',
-                    'app.powerbi.com/reportEmbed', 'app.powerbi.com/groups',
-                    'sharepoint.com/personal', 'sharepoint.com/_layouts',
-                    'office.com/login/success', 'login.microsoftonline.com/common/reprocess',
-                    'powerbi.com/view', 'powerbi.com/reports'
-                ]
-                
-                # Also check for specific Power BI embed URLs
-                if any(indicator in url_str.lower() for indicator in success_indicators):
-                    print("Authentication appears successful, closing popup")
-                    popup_dialog.accept()
-                    if hasattr(self, 'view') and self.view():
-                        # Delay reload to allow session to propagate
-                        def delayed_reload():
-                            self.view().reload()
-                        QTimer.singleShot(1000, delayed_reload)  # 1 second delay
-            
-            new_page.loadFinished.connect(on_load_finished)
-            new_page.urlChanged.connect(on_url_changed)
+            if log.isEnabledFor(logging.DEBUG):
+                new_page.loadFinished.connect(self._on_popup_load_finished)
+            new_page.urlChanged.connect(partial(self._on_popup_url_changed, popup_dialog))
             
             # Show popup in non-blocking way
             popup_dialog.show()
             
-            print("Popup dialog created and shown")
+            log.debug("Popup dialog created and shown")
             return new_page
             
         except Exception as e:
-            print(f"Error in createWindow: {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception("Error in createWindow: %s", e)
             return None
     
+    def _on_popup_load_finished(self, success):
+        log.debug("Popup load finished: %s", success)
+
+    def _on_popup_url_changed(self, popup_dialog, url):
+        url_str = url.toString()
+        log.debug("Popup URL: %s", url_str)
+        
+        # Check for Microsoft authentication success indicators, including Power BI embed URLs
+        if _AUTH_SUCCESS_RE.search(url_str):
+            log.info("Authentication appears successful, closing popup")
+            popup_dialog.accept()
+            if self.view():
+                # Delay reload to allow session to propagate
+                self._schedule_reload()
+
+    def _schedule_reload(self):
+        """Reloads the view after 200 ms, restarting the countdown if already pending."""
+        timer = getattr(self, '_reload_timer', None)
+        if timer is None:
+            timer = self._reload_timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.setInterval(200)  # Session cookies are already in the shared profile store
+            timer.timeout.connect(self._reload_view)
+        timer.start()  # Restarts an active timer, so a redirect chain yields one reload
+
+    def _reload_view(self):
+        view = self.view()
+        if view is not None:
+            view.reload()
+
+    def _release_popup(self, key, _result=None):
+        """Drops a closed popup and lets Qt delete its dialog, view and page."""
+        refs = self._popup_refs.pop(key, None)
+        if refs is not None:
+            refs[0].deleteLater()
+
     def acceptNavigationRequest(self, url, _type, isMainFrame):
         """Handle navigation requests, including popup attempts."""
-        print(f"Navigation request: {url.toString()} (type: {_type}, mainFrame: {isMainFrame})")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("Navigation request: %s (type: %s, mainFrame: %s)", url.toString(), _type, isMainFrame)
         # Allow all navigation requests
         return True
 
 
 class BrowserWindow(QMainWindow):
+    visibility_changed = pyqtSignal(str, bool)  # (window_id, visible)
+
+    # Persistent profile cookies from a successful NTLM priming are reused this long
+    _NTLM_REPRIME_INTERVAL = 30 * 60  # seconds
+
+    _CONTAINER_QSS = """
+    QWidget {
+        background-color: #2d5a2d;
+        border-radius: 8px;
+        padding: 3px;
+    }
+    """
+    _BROWSER_QSS = """
+    QWebEngineView {
+        border: none;
+        background-color: white;
+    }
+    """
+
     def __init__(self, profile, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Authenticated Browser")
@@ -246,19 +384,14 @@ class BrowserWindow(QMainWindow):
         self.window_id = None
         self.current_url = None
         self.refresh_timer = None
-        self.background_browser = None  # QWebEngineView used in preloader window
-        self.background_window = None   # Offscreen QMainWindow hosting background_browser
+        self.background_page = None  # Viewless page preloading the next refresh
+        self._ready_checks = 0
+        self._ntlm_primed_at = None  # time.monotonic() of the last successful priming
         self.profile = profile
 
         # Create a container widget for the border effect
         container = QWidget()
-        container.setStyleSheet("""
-            QWidget {
-                background-color: #2d5a2d;
-                border-radius: 8px;
-                padding: 3px;
-            }
-        """)
+        container.setStyleSheet(self._CONTAINER_QSS)
         
         # Create layout for container
         from PyQt6.QtWidgets import QVBoxLayout
@@ -271,12 +404,7 @@ class BrowserWindow(QMainWindow):
         self.browser.setPage(self.page)
         
         # Style the browser view
-        self.browser.setStyleSheet("""
-            QWebEngineView {
-                border: none;
-                background-color: white;
-            }
-        """)
+        self.browser.setStyleSheet(self._BROWSER_QSS)
         
         # Add browser to container
         container_layout.addWidget(self.browser)
@@ -286,14 +414,21 @@ class BrowserWindow(QMainWindow):
         # Remove translucent background to show borders
         # self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
 
-        self.edit_overlay = EditOverlay(self)
-        self.edit_overlay.hide()
+        # Created on first entry into edit mode
+        self.edit_overlay = None
+
+        # Coalesces overlay relayouts while the window is being resized
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._finish_resize)
 
         # debug signals
-        self.browser.loadProgress.connect(lambda p: print(f"[browser] load {p}%"))
-        self.browser.loadFinished.connect(lambda ok: print("[browser] finished:", ok))
+        if log.isEnabledFor(logging.DEBUG):
+            self.browser.loadProgress.connect(self._on_load_progress)
+            self.browser.loadFinished.connect(self._on_load_finished)
         # Provide credentials if the engine requests them at the page level
-        if WebProfileManager().has_credentials():
+        if get_profile_manager().has_credentials():
             try:
                 self.page.authenticationRequired.connect(self._on_auth_required)
             except Exception:
@@ -301,7 +436,7 @@ class BrowserWindow(QMainWindow):
 
 
     def load_url(self, url, window_id=None):
-        print("Loading:", url)
+        log.debug("Loading: %s", url)
         
         # Store window ID and URL for potential background refresh
         self.window_id = window_id
@@ -311,20 +446,37 @@ class BrowserWindow(QMainWindow):
         if window_id == "sharepoint_document":
             self._setup_background_refresh()
         
-        # If we have explicit creds, attempt NTLM session first to prime cookies
+        # If we have explicit creds, prime cookies with an NTLM session first;
+        # the page loads once the (background) request has completed
         try:
-            pm = WebProfileManager()
+            pm = get_profile_manager()
             if pm.has_credentials():
-                pm.ntlm_session_and_inject(url)
+                pm.ntlm_session_and_inject(url, callback=lambda ok: self._on_ntlm_primed(url, ok))
+                return
         except Exception as e:
-            print("[auth] NTLM pre-injection failed:", e)
-        self.browser.setUrl(QUrl(url))
+            log.warning("[auth] NTLM pre-injection failed: %s", e)
+        self.page.setUrl(QUrl(url))
+
+    def _on_ntlm_primed(self, url, ok=True):
+        """Loads the URL once NTLM cookie priming has finished."""
+        if ok:
+            self._ntlm_primed_at = time.monotonic()
+        if url == self.current_url:
+            self.page.setUrl(QUrl(url))
+
+    def _on_load_progress(self, progress):
+        log.debug("[browser] load %d%%", progress)
+
+    def _on_load_finished(self, ok):
+        log.debug("[browser] finished: %s", ok)
     
     def get_zoom_level(self):
         """Get current zoom level as percentage."""
+        if self.edit_overlay is not None:
+            self.edit_overlay.apply_pending_zoom()
         zoom_factor = self.browser.zoomFactor()
         zoom_percentage = int(zoom_factor * 100)
-        print(f"[DEBUG] Getting zoom level: factor={zoom_factor}, percentage={zoom_percentage}")
+        log.debug("Getting zoom level: factor=%s, percentage=%d", zoom_factor, zoom_percentage)
         return zoom_percentage
     
     def set_zoom_level(self, zoom_percentage):
@@ -333,8 +485,8 @@ class BrowserWindow(QMainWindow):
         self.browser.setZoomFactor(zoom_factor)
         
         # Update the zoom slider if overlay is active
-        if hasattr(self.edit_overlay, '_zoom_slider'):
-            self.edit_overlay._zoom_slider.setValue(zoom_percentage)
+        if self.edit_overlay is not None:
+            self.edit_overlay.sync_zoom_slider(zoom_percentage)
     
     def _setup_background_refresh(self):
         """Setup background refresh timer for SharePoint document."""
@@ -344,118 +496,92 @@ class BrowserWindow(QMainWindow):
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self._start_background_load)
         self.refresh_timer.start(60000)  # 60 seconds
-        print("[refresh] Background refresh timer started for SharePoint document (60s)")
+        log.debug("[refresh] Background refresh timer started for SharePoint document (60s)")
     
     def _start_background_load(self):
-        """Start loading the page in an offscreen preloader window."""
+        """Start loading the page in a background page that is not attached to any view."""
         if not self.current_url:
             return
             
-        print("[refresh] Starting background load...")
-        
-        # Clean up any previous preloader window
-        if self.background_window:
-            try:
-                self.background_window.close()
-                self.background_window.deleteLater()
-            except Exception:
-                pass
-            self.background_window = None
-            self.background_browser = None
-
-        # Create an offscreen preloader window so rendering is decoupled from layout
-        from PyQt6.QtWidgets import QMainWindow as _QMainWindow
-        self.background_window = _QMainWindow(None)
-        # Make it a tool window without taskbar and frameless
-        self.background_window.setWindowFlags(
-            Qt.WindowType.Tool | Qt.WindowType.FramelessWindowHint
-        )
-        # Fully transparent and offscreen
-        self.background_window.setWindowOpacity(0.0)
-        self.background_window.move(-20000, -20000)
-        # Match the size of the visible browser to avoid re-layout cost later
-        self.background_window.resize(self.browser.size())
-
-        # Create the background view inside the preloader window
-        self.background_browser = QWebEngineView(self.background_window)
-        new_page = CustomWebEnginePage(self.profile, self)
-        self.background_browser.setPage(new_page)
-        self.background_window.setCentralWidget(self.background_browser)
+        log.debug("[refresh] Starting background load...")
         
-        # Track loading progress to ensure 100% completion
-        self.background_load_progress = 0
-        self.background_browser.loadProgress.connect(self._on_background_load_progress)
-        
-        # Apply styling immediately (same as visible one)
-        self.background_browser.setStyleSheet("""
-            QWebEngineView {
-                border: none;
-                background-color: white;
-                border-radius: 5px;
-            }
-        """)
-        
-        # Make the window visible (opacity 0) so Chromium actually renders frames
-        # Avoid input and ensure it's truly background
-        self.background_browser.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-        self.background_window.show()
+        # Discard any previous preload that never got swapped in
+        if self.background_page is not None:
+            self.background_page.blockSignals(True)
+            self.background_page.deleteLater()
+            self.background_page = None
+
+        # A bare page loads the document without a widget backing store;
+        # it only starts rendering once the visible view adopts it
+        background_page = CustomWebEnginePage(self.profile, self)
+        self.background_page = background_page
         
-        # Connect to load finished signal
-        self.background_browser.loadFinished.connect(self._on_background_load_finished)
+        # Readiness is decided on loadFinished; progress is only reported at DEBUG level
+        if log.isEnabledFor(logging.DEBUG):
+            background_page.loadProgress.connect(self._on_background_load_progress)
+        background_page.loadFinished.connect(self._on_background_load_finished)
         
-        # Prepare background browser with authentication
+        # Prepare the background page with authentication, then start loading it
+        url = self.current_url
+
+        def start_load(primed=False):
+            if primed:
+                self._ntlm_primed_at = time.monotonic()
+            if self.background_page is background_page:
+                background_page.setUrl(QUrl(url))
+
         try:
-            pm = WebProfileManager()
-            if pm.has_credentials():
-                pm.ntlm_session_and_inject(self.current_url)
+            pm = get_profile_manager()
+            if pm.has_credentials() and not self._ntlm_cookies_fresh():
+                pm.ntlm_session_and_inject(url, callback=start_load)
+                return
         except Exception as e:
-            print("[refresh] NTLM pre-injection failed:", e)
+            log.warning("[refresh] NTLM pre-injection failed: %s", e)
             
-        # Start loading in background
-        self.background_browser.setUrl(QUrl(self.current_url))
+        start_load()
+    
+    def _ntlm_cookies_fresh(self):
+        """True if NTLM cookies were primed recently enough to skip another handshake."""
+        primed_at = self._ntlm_primed_at
+        return primed_at is not None and time.monotonic() - primed_at < self._NTLM_REPRIME_INTERVAL
     
     def _on_background_load_progress(self, progress):
-        """Track background loading progress."""
-        self.background_load_progress = progress
+        """Report background loading progress."""
         if progress % 20 == 0:  # Log every 20% to avoid spam
-            print(f"[refresh] Background load progress: {progress}%")
+            log.debug("[refresh] Background load progress: %d%%", progress)
     
     def _on_background_load_finished(self, success):
-        """Handle background load completion and swap browsers with smooth transition."""
-        if not success or not self.background_browser:
-            print("[refresh] Background load failed, keeping current browser")
-            return
-            
-        # Ensure we actually reached 100% progress
-        if self.background_load_progress < 100:
-            print(f"[refresh] Load finished but progress only {self.background_load_progress}%, waiting more...")
-            QTimer.singleShot(1000, lambda: self._on_background_load_finished(True))
+        """Handle background load completion and swap pages once the document is ready."""
+        if not success or self.background_page is None:
+            log.warning("[refresh] Background load failed, keeping current browser")
             return
             
-        print(f"[refresh] Background load completed (100%), waiting for rendering...")
-        
-        # Reduced delay since geometry is set from the beginning
-        QTimer.singleShot(2000, self._check_and_perform_swap)  # Reduced to 2 seconds
+        log.debug("[refresh] Background load completed, checking document readiness...")
+        self._ready_checks = 0
+        self._check_and_perform_swap()
     
     def _check_and_perform_swap(self):
-        """Check if page is ready and perform the swap."""
-        if not self.background_browser:
+        """Ask the background page for its readyState; the reply decides the swap."""
+        page = self.background_page
+        if page is None:
             return
-            
-        print("[refresh] Checking page rendering state...")
-        
-        # Force a repaint to ensure everything is rendered
-        self.background_browser.repaint()
-        self.background_browser.update()
-        
-        # Reduced additional delay since geometry is correct from start
-        QTimer.singleShot(1000, self._perform_smooth_swap)  # Reduced to 1 second
+        page.runJavaScript("document.readyState", partial(self._on_background_ready_state, page))
+    
+    def _on_background_ready_state(self, page, state):
+        if page is not self.background_page:
+            return  # Superseded by a newer preload, or already swapped
+        self._ready_checks += 1
+        if state == "complete" or self._ready_checks >= 25:
+            self._perform_smooth_swap()
+        else:
+            log.debug("[refresh] Document state is %s, checking again...", state)
+            QTimer.singleShot(200, self._check_and_perform_swap)
     
     def _perform_smooth_swap(self):
         """Perform the actual swap by moving the loaded page into the visible view."""
-        if not self.background_browser:
+        if self.background_page is None:
             return
-        print("[refresh] Performing smooth browser page swap...")
+        log.debug("[refresh] Performing smooth browser page swap...")
 
         # Fade out current content instantly to avoid flash
         self.browser.setWindowOpacity(0.0)
@@ -463,38 +589,31 @@ class BrowserWindow(QMainWindow):
         # Swap pages: take the page from background view and assign to visible view
         try:
             old_page = self.browser.page()
-            new_page = self.background_browser.page()
+            new_page, self.background_page = self.background_page, None
+            # The page now belongs to the visible view; stop treating its loads as preloads
+            try:
+                new_page.loadProgress.disconnect(self._on_background_load_progress)
+            except TypeError:
+                pass  # Only connected at DEBUG level
+            new_page.loadFinished.disconnect(self._on_background_load_finished)
             self.browser.setPage(new_page)
             # Restore handlers if needed (already CustomWebEnginePage)
             self.page = new_page
             # Reconnect auth handler to the new page if credentials exist
-            if WebProfileManager().has_credentials():
+            if get_profile_manager().has_credentials():
                 try:
                     self.page.authenticationRequired.connect(self._on_auth_required)
                 except Exception:
                     pass
-            # Clean up old page to free resources
+            # Clean up old page to free resources; silence it until it is destroyed
             if old_page is not None:
+                old_page.blockSignals(True)
                 old_page.deleteLater()
         except Exception as e:
-            print(f"[refresh] Error during page swap: {e}")
+            log.error("[refresh] Error during page swap: %s", e)
         
         # Fade in the new content
         self.browser.setWindowOpacity(1.0)
-        
-        # Cleanup the preloader window and its view
-        QTimer.singleShot(50, self._cleanup_preloader)
-    
-    def _cleanup_preloader(self):
-        """Dispose of the offscreen preloader window and reset state."""
-        try:
-            if self.background_window:
-                self.background_window.close()
-                self.background_window.deleteLater()
-        except Exception:
-            pass
-        self.background_window = None
-        self.background_browser = None
     
     # Remove old widget-swap path; page swap is used instead
         
@@ -503,49 +622,82 @@ class BrowserWindow(QMainWindow):
         try:
             old_browser.deleteLater()
         except Exception as e:
-            print(f"[refresh] Error cleaning up old browser: {e}")
+            log.error("[refresh] Error cleaning up old browser: %s", e)
 
     def set_geometry(self, x, y, width, height):
         """Set the geometry of the browser window."""
-        self.setGeometry(QRect(x, y, width, height))
+        self.setGeometry(x, y, width, height)
 
     def set_edit_mode(self, enabled):
         """Shows or hides the edit overlay with zoom controls."""
         if enabled:
+            if self.edit_overlay is None:
+                self.edit_overlay = EditOverlay(self)
+            # Lay out and stack the overlay while it is still hidden, so that
+            # show() exposes it in its final state with a single paint
             self.edit_overlay.setGeometry(self.rect())
-            self.edit_overlay.show()
             self.edit_overlay.show_zoom_controls()
             self.edit_overlay.raise_()
-        else:
+            self.edit_overlay.show()
+        elif self.edit_overlay is not None:
             self.edit_overlay.hide_zoom_controls()
             self.edit_overlay.hide()
     
     def _on_auth_required(self, requestUrl, auth):
         try:
-            user, pwd = WebProfileManager().get_auth_credentials()
+            user, pwd = get_profile_manager().get_auth_credentials()
             if hasattr(auth, "setUser") and hasattr(auth, "setPassword"):
                 auth.setUser(user)
                 auth.setPassword(pwd)
-                print("[auth] Provided credentials to authenticationRequired signal")
+                log.debug("[auth] Provided credentials to authenticationRequired signal")
         except Exception as e:
-            print("[auth] Error supplying credentials:", e)
+            log.error("[auth] Error supplying credentials: %s", e)
             
     def resizeEvent(self, event):
-        """Ensure the overlay is always the same size as the window."""
+        """Ensure the overlay is always the same size as the window, once the resize settles."""
         super().resizeEvent(event)
-        if self.edit_overlay.isVisible():
-            self.edit_overlay.setGeometry(self.rect())
+        if self.edit_overlay is not None and self.edit_overlay.isVisible():
+            # Suppress intermediate web view paints for the duration of the gesture
+            if not self._resize_timer.isActive():
+                self.browser.setUpdatesEnabled(False)
+            self._resize_timer.start()
+
+    def _finish_resize(self):
+        self.browser.setUpdatesEnabled(True)
+        overlay = self.edit_overlay
+        if overlay is not None and overlay.isVisible():
+            # The overlay's own resizeEvent moves the zoom widget; paint it all once
+            overlay.setUpdatesEnabled(False)
+            overlay.setGeometry(self.rect())
+            overlay.setUpdatesEnabled(True)
     
+    def showEvent(self, event):
+        """Report programmatic show() calls to listeners."""
+        super().showEvent(event)
+        if self.window_id and not event.spontaneous():
+            self.visibility_changed.emit(self.window_id, True)
+
+    def hideEvent(self, event):
+        """Report programmatic hide() calls to listeners."""
+        super().hideEvent(event)
+        if self.window_id and not event.spontaneous():
+            self.visibility_changed.emit(self.window_id, False)
+
+    def changeEvent(self, event):
+        """Marks the page hidden while minimized so Chromium throttles its rendering."""
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            page = self.browser.page()
+            visible = not self.isMinimized()
+            if page.isVisible() != visible:
+                page.setVisible(visible)
+
     def closeEvent(self, event):
         """Clean up resources when closing the window."""
         if self.refresh_timer:
             self.refresh_timer.stop()
-        if self.background_browser:
-            self.background_browser.deleteLater()
-        if self.background_window:
-            try:
-                self.background_window.close()
-                self.background_window.deleteLater()
-            except Exception:
-                pass
+        if self.background_page is not None:
+            self.background_page.blockSignals(True)
+            self.background_page.deleteLater()
+            self.background_page = None
         super().closeEvent(event)
\ No newline at end of file
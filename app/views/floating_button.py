@@ -1,13 +1,63 @@
+from functools import lru_cache, partial
+
 from PyQt6.QtWidgets import QWidget, QPushButton, QApplication, QMenu, QWidgetAction
 from PyQt6.QtCore import Qt, QPoint, QPropertyAnimation, QEasingCurve, QParallelAnimationGroup, pyqtSignal
-from PyQt6.QtGui import QPainter, QColor
+from PyQt6.QtGui import QFont
+
+_VIEW_MENU_QSS = """
+    QMenu {
+        background-color: #2d3748;
+        color: white;
+        border: 1px solid #4a5568;
+        border-radius: 6px;
+        padding: 4px;
+    }
+    QMenu::item {
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    QMenu::item:selected {
+        background-color: #4a5568;
+    }
+"""
+
+@lru_cache(maxsize=None)
+def _dpi_multiplier():
+    """Scale multiplier for the primary screen; FloatingActionMenu clears it when the screen or its DPI changes"""
+    dpi_ratio = QApplication.primaryScreen().logicalDotsPerInch() / 96.0  # 96 DPI is standard
+    # More conservative scaling to prevent oversized elements
+    return min(dpi_ratio * 0.8, 1.5)  # Cap at 1.5x scaling
+
+@lru_cache(maxsize=None)
+def _child_button_qss(border_radius):
+    """Child button stylesheet; built once per radius and shared by every button"""
+    return f"""
+        QPushButton {{
+            background-color: #55595f;
+            color: white;
+            border-radius: {border_radius}px;
+            border: 1px solid #777;
+            padding: 0px;
+            margin: 0px;
+            text-align: center;
+            vertical-align: middle;
+        }}
+        QPushButton:hover {{
+            background-color: #6c7178;
+        }}
+    """
+
+@lru_cache(maxsize=None)
+def _make_font(family, pixel_size, bold):
+    """Bold/pixel-sized button font, shared between buttons (QFont is implicitly shared)"""
+    font = QFont(family)
+    font.setPixelSize(pixel_size)  # Use pixel size for more precise control
+    font.setBold(bold)
+    return font
 
 def get_scaled_size(base_size):
     """Get size scaled for high DPI displays"""
-    screen = QApplication.primaryScreen()
-    dpi_ratio = screen.logicalDotsPerInch() / 96.0  # 96 DPI is standard
-    # More conservative scaling to prevent oversized elements
-    return max(base_size, int(base_size * min(dpi_ratio * 0.8, 1.5)))  # Cap at 1.5x scaling
+    return max(base_size, int(base_size * _dpi_multiplier()))
 
 class MainButton(QPushButton):
     """
@@ -16,21 +66,24 @@ class MainButton(QPushButton):
     """
     def __init__(self, text, parent=None):
         super().__init__(text, parent)
-        self._drag_start_position = None
+        self._drag_offset = None  # (x, y) of the press point relative to the parent's frame
         self._mouse_press_position = None
 
     def mousePressEvent(self, event):
         if event.button() == Qt.MouseButton.LeftButton:
             # We get the position relative to the parent (the FloatingActionMenu)
             gp = event.globalPosition().toPoint()
-            self._drag_start_position = gp - self.parent().frameGeometry().topLeft()
+            top_left = self.parent().frameGeometry().topLeft()
+            self._drag_offset = (gp.x() - top_left.x(), gp.y() - top_left.y())
             self._mouse_press_position = gp
             event.accept()
 
     def mouseMoveEvent(self, event):
-        if event.buttons() == Qt.MouseButton.LeftButton and self._drag_start_position:
+        if event.buttons() == Qt.MouseButton.LeftButton and self._drag_offset is not None:
             # We move the parent widget, not the button itself
-            self.parent().move(event.globalPosition().toPoint() - self._drag_start_position)
+            gp = event.globalPosition()
+            dx, dy = self._drag_offset
+            self.parent().move(round(gp.x()) - dx, round(gp.y()) - dy)
             event.accept()
 
     def mouseReleaseEvent(self, event):
@@ -40,23 +93,9 @@ class MainButton(QPushButton):
                 # If it was a click, not a drag, emit the standard clicked signal
                 self.click()
 
-            self._drag_start_position = None
+            self._drag_offset = None
             self._mouse_press_position = None
             event.accept()
-    
-    def paintEvent(self, event):
-        """Custom paint event to ensure perfect text centering."""
-        super().paintEvent(event)
-        
-        # Draw the text manually in the center
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setFont(self.font())
-        painter.setPen(QColor("white"))
-        
-        # Calculate the center position
-        text_rect = self.rect()
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, self.text())
 
 
 class ChildButton(QPushButton):
@@ -72,46 +111,14 @@ class ChildButton(QPushButton):
         self.setFixedSize(button_size, button_size)
         
         # Use a more compatible font for better Unicode support
-        font = self.font()
-        font.setPixelSize(font_size)  # Use pixel size for more precise control
-        font.setBold(True)
-        font.setFamily("Arial Unicode MS")  # Better Unicode symbol support
-        self.setFont(font)
+        self.setFont(_make_font("Arial Unicode MS", font_size, True))
         
         # Improved centering with proper padding
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: #55595f;
-                color: white;
-                border-radius: {border_radius}px;
-                border: 1px solid #777;
-                padding: 0px;
-                margin: 0px;
-                text-align: center;
-                vertical-align: middle;
-            }}
-            QPushButton:hover {{
-                background-color: #6c7178;
-            }}
-        """)
+        self.setStyleSheet(_child_button_qss(border_radius))
         
         # Force center alignment
         self.setContentsMargins(0, 0, 0, 0)
         self.setAttribute(Qt.WidgetAttribute.WA_LayoutUsesWidgetRect)
-    
-    def paintEvent(self, event):
-        """Custom paint event to ensure perfect text centering."""
-        super().paintEvent(event)
-        
-        # Draw the text manually in the center
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        painter.setFont(self.font())
-        painter.setPen(QColor("white"))
-        
-        # Calculate the center position
-        text_rect = self.rect()
-        painter.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, self.text())
 
 
 class FloatingActionMenu(QWidget):
@@ -127,8 +134,19 @@ class FloatingActionMenu(QWidget):
         super().__init__(parent)
         self._is_expanded = False
         self._child_buttons = []
+        self._child_anims = []  # One reusable pos animation per child button
+        self._actions = ()
         self._animation_group = QParallelAnimationGroup()
+        self._animating = False  # Main button clicks are ignored until the running toggle finishes
+        self._geom_dirty = True  # Expansion geometry is recomputed when the buttons change
+        self._geom_scale = None
         self.view_manager = None  # Will be set from controller
+        self._view_menu = None  # Built and styled on first use, then repopulated
+        
+        # Drop the cached DPI multiplier when the primary screen or its DPI changes
+        self._watched_screen = None
+        QApplication.instance().primaryScreenChanged.connect(self._on_primary_screen_changed)
+        self._watch_screen(QApplication.primaryScreen())
         
         # Main Container Widget Setup
         self.setWindowFlags(
@@ -147,11 +165,7 @@ class FloatingActionMenu(QWidget):
         main_border_radius = main_button_size // 2
         
         self.main_button.setFixedSize(main_button_size, main_button_size)
-        font = self.main_button.font()
-        font.setPixelSize(main_font_size)  # Use pixel size for precise control
-        font.setBold(True)
-        font.setFamily("Arial")  # Simple, reliable font
-        self.main_button.setFont(font)
+        self.main_button.setFont(_make_font("Arial", main_font_size, True))  # Simple, reliable font
         
         self.main_button.setStyleSheet(f"""
             QPushButton {{
@@ -169,11 +183,35 @@ class FloatingActionMenu(QWidget):
             }}
         """)
         self.main_button.setContentsMargins(0, 0, 0, 0)
-        self.main_button.clicked.connect(self.toggle_menu)
+        self.main_button.clicked.connect(self._on_main_clicked)
+
+        # Container and main button animations are reused by every toggle
+        self._size_anim = QPropertyAnimation(self, b"geometry")
+        self._main_pos_anim = QPropertyAnimation(self.main_button, b"pos")
+        self._animation_group.addAnimation(self._size_anim)
+        self._animation_group.addAnimation(self._main_pos_anim)
+        self._animation_group.finished.connect(self._on_animation_finished)
 
         # Initial size is just the main button
         self.resize(self.main_button.size())
     
+    def _watch_screen(self, screen):
+        """Follows logicalDotsPerInchChanged of the given (primary) screen only."""
+        if self._watched_screen is not None:
+            try:
+                self._watched_screen.logicalDotsPerInchChanged.disconnect(self._on_screen_dpi_changed)
+            except (TypeError, RuntimeError):
+                pass  # Already disconnected, or the old screen was removed
+        self._watched_screen = screen
+        screen.logicalDotsPerInchChanged.connect(self._on_screen_dpi_changed)
+
+    def _on_primary_screen_changed(self, screen):
+        self._watch_screen(screen)
+        _dpi_multiplier.cache_clear()
+
+    def _on_screen_dpi_changed(self, _dpi):
+        _dpi_multiplier.cache_clear()
+
     def set_view_manager(self, view_manager):
         """Set the view manager for this menu."""
         self.view_manager = view_manager
@@ -183,23 +221,12 @@ class FloatingActionMenu(QWidget):
         if not self.view_manager:
             return
         
-        menu = QMenu(self)
-        menu.setStyleSheet("""
-            QMenu {
-                background-color: #2d3748;
-                color: white;
-                border: 1px solid #4a5568;
-                border-radius: 6px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QMenu::item:selected {
-                background-color: #4a5568;
-            }
-        """)
+        menu = self._view_menu
+        if menu is None:
+            menu = self._view_menu = QMenu(self)
+            menu.setStyleSheet(_VIEW_MENU_QSS)
+        else:
+            menu.clear()
         
         views = self.view_manager.get_views()
         current_view_id = self.view_manager.get_current_view_id()
@@ -231,62 +258,119 @@ class FloatingActionMenu(QWidget):
         button.clicked.connect(action_callable)
         self._child_buttons.append(button)
 
+        anim = QPropertyAnimation(button, b"pos")
+        anim.finished.connect(partial(self._on_child_anim_finished, button))
+        self._animation_group.addAnimation(anim)
+        self._child_anims.append(anim)
+        self._geom_dirty = True
+
+    def _on_child_anim_finished(self, button):
+        if not self._is_expanded:
+            button.hide()
+
+    def _on_animation_finished(self):
+        self._animating = False
+
     def clear_actions(self):
         """Removes all action buttons from the menu."""
+        self._animation_group.stop()
+        self._animating = False  # stop() does not emit finished
+        for anim in self._child_anims:
+            self._animation_group.removeAnimation(anim)
+            anim.deleteLater()
+        self._child_anims.clear()
         for button in self._child_buttons:
             button.deleteLater()
         self._child_buttons.clear()
+        self._geom_dirty = True
         
+    def replace_action(self, index, icon_char, action_callable):
+        """Rebinds an existing action button in place."""
+        button = self._child_buttons[index]
+        button.setText(icon_char)
+        button.clicked.disconnect()
+        button.clicked.connect(action_callable)
+
     def update_actions(self, actions):
         """Updates the menu with a new set of actions.
         
         Args:
-            actions: List of tuples (icon_char, action_callable)
+            actions: Sequence of tuples (icon_char, action_callable)
         """
-        self.clear_actions()
-        for icon_char, action_callable in actions:
-            self.add_action(icon_char, action_callable)
+        actions = tuple(actions)
+        if actions == self._actions:
+            return
+
+        if len(actions) == len(self._actions):
+            # Same shape - only rebind the buttons whose action changed
+            for index, (old, new) in enumerate(zip(self._actions, actions)):
+                if old != new:
+                    self.replace_action(index, *new)
+        else:
+            self.clear_actions()
+            for icon_char, action_callable in actions:
+                self.add_action(icon_char, action_callable)
+        self._actions = actions
+
+    def _recompute_layout(self):
+        """Caches the expanded height and each child button's expanded position."""
+        # Calculate spacing based on scaled sizes
+        button_spacing = get_scaled_size(60)  # Adjusted for new button size
+        button_offset = get_scaled_size(8)    # Adjusted offset
+        self._expanded_height = (len(self._child_buttons) + 1) * button_spacing + get_scaled_size(5)
+
+        # Once expanded, the main button sits at the bottom of the widget
+        main_y = self._expanded_height - self.main_button.height()
+        self._expanded_main_pos = QPoint(0, main_y)
+        self._end_positions = [QPoint(button_offset, main_y - (i + 1) * button_spacing)
+                               for i in range(len(self._child_buttons))]
+        self._geom_scale = _dpi_multiplier()
+        self._geom_dirty = False
+
+    @staticmethod
+    def _set_anim(anim, start, end, duration):
+        """Sets an animation's range; one with nothing to move finishes without ticking."""
+        anim.setStartValue(start)
+        anim.setEndValue(end)
+        anim.setDuration(duration if start != end else 0)
+
+    def _on_main_clicked(self):
+        # Coalesce rapid clicks: let the running expand/collapse finish first.
+        # Programmatic toggle_menu() calls (auto-close after an action) are not debounced.
+        if not self._animating:
+            self.toggle_menu()
 
     def toggle_menu(self):
+        # Nothing to reveal; a menu left expanded by clear_actions() can still collapse
+        if not self._child_buttons and not self._is_expanded:
+            return
+
         self.raise_()
         
         self._animation_group.stop()
-        self._animation_group = QParallelAnimationGroup()
 
-        # Calculate spacing based on scaled sizes
-        button_spacing = get_scaled_size(60)  # Adjusted for new button size
-        button_offset = get_scaled_size(8)    # Adjusted offset
-        expanded_height = (len(self._child_buttons) + 1) * button_spacing + get_scaled_size(5)
+        if self._geom_dirty or self._geom_scale != _dpi_multiplier():
+            self._recompute_layout()
+        expanded_height = self._expanded_height
 
         if self._is_expanded:
             self.main_button.setText("M")
             self._is_expanded = False
             
             # COLLAPSE LOGIC
-            buttons_to_animate = self._child_buttons[:]
-            buttons_to_animate.reverse()
-
-            for i, button in enumerate(buttons_to_animate):
-                anim = QPropertyAnimation(button, b"pos")
-                anim.setEndValue(QPoint(0,0)) # Animate back to the top-left of the container
+            for i, (button, anim) in enumerate(zip(reversed(self._child_buttons), reversed(self._child_anims))):
+                # Animate back to the top-left of the container
+                self._set_anim(anim, button.pos(), QPoint(0,0), 200 + i * 40)
                 anim.setEasingCurve(QEasingCurve.Type.InOutCubic)
-                anim.setDuration(200 + i * 40)
-                self._animation_group.addAnimation(anim)
-                anim.finished.connect(button.hide)
 
             # Animate the container back to its original size AND position
-            size_anim = QPropertyAnimation(self, b"geometry")
             current_geo = self.geometry()
             # The final geometry is the original 60x60, but at the current x,y location
-            size_anim.setEndValue(current_geo.adjusted(0, expanded_height - self.main_button.height(), 0, 0))
-            size_anim.setDuration(300)
-            self._animation_group.addAnimation(size_anim)
+            self._set_anim(self._size_anim, current_geo,
+                           current_geo.adjusted(0, expanded_height - self.main_button.height(), 0, 0), 300)
             
             # Move the main button back to the top as the container shrinks
-            button_pos_anim = QPropertyAnimation(self.main_button, b"pos")
-            button_pos_anim.setEndValue(QPoint(0,0))
-            button_pos_anim.setDuration(300)
-            self._animation_group.addAnimation(button_pos_anim)
+            self._set_anim(self._main_pos_anim, self.main_button.pos(), QPoint(0,0), 300)
 
         else:
             self.main_button.setText("\u2715") # X Symbol
@@ -300,20 +384,20 @@ class FloatingActionMenu(QWidget):
                              expanded_height)
             
             # Move main button to the bottom of the now larger widget
-            self.main_button.move(0, self.height() - self.main_button.height())
+            start_pos = self._expanded_main_pos
+            self.main_button.move(start_pos)
 
-            for i, button in enumerate(self._child_buttons):
+            for i, (button, anim, end_pos) in enumerate(zip(self._child_buttons, self._child_anims, self._end_positions)):
                 button.show()
-                # Ensure child buttons are also at the bottom before animating up
-                button.move(self.main_button.pos()) 
-                
-                anim = QPropertyAnimation(button, b"pos")
-                start_pos = self.main_button.pos()
-                end_pos = QPoint(start_pos.x() + button_offset, start_pos.y() - (i + 1) * button_spacing)
-                anim.setStartValue(start_pos)
-                anim.setEndValue(end_pos)
+                # The animation places the button at start_pos when the group starts,
+                # before the next paint, so no separate move() is needed
+                self._set_anim(anim, start_pos, end_pos, 350 + i * 50)
                 anim.setEasingCurve(QEasingCurve.Type.OutBounce)
-                anim.setDuration(350 + i * 50)
-                self._animation_group.addAnimation(anim)
 
+            # The container and main button are already in place; hold them there
+            geo = self.geometry()
+            self._set_anim(self._size_anim, geo, geo, 0)
+            self._set_anim(self._main_pos_anim, start_pos, start_pos, 0)
+
+        self._animating = True
         self._animation_group.start()
\ No newline at end of file
@@ -3,6 +3,50 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
+# Dark theme; the error rule applies while the name field has its "error" property set
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+        font-size: 12px;
+    }
+    QLineEdit, QTextEdit {
+        background-color: #3c3c3c;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 6px;
+        color: #ffffff;
+        font-size: 11px;
+    }
+    QLineEdit:focus, QTextEdit:focus {
+        border: 2px solid #007BFF;
+    }
+    QLineEdit[error="true"] {
+        border: 2px solid #dc3545;
+    }
+    QPushButton {
+        background-color: #007BFF;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-size: 11px;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #0056b3;
+    }
+    QPushButton#cancel_button {
+        background-color: #6c757d;
+    }
+    QPushButton#cancel_button:hover {
+        background-color: #545b62;
+    }
+"""
+
 class SaveLayoutDialog(QDialog):
     """Dialog for saving a custom layout with a name and description."""
     
@@ -13,45 +57,7 @@ class SaveLayoutDialog(QDialog):
         self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.WindowCloseButtonHint)
         
         # Apply dark theme styling
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-                font-size: 12px;
-            }
-            QLineEdit, QTextEdit {
-                background-color: #3c3c3c;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 6px;
-                color: #ffffff;
-                font-size: 11px;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border: 2px solid #007BFF;
-            }
-            QPushButton {
-                background-color: #007BFF;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-size: 11px;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton#cancel_button {
-                background-color: #6c757d;
-            }
-            QPushButton#cancel_button:hover {
-                background-color: #545b62;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
         
         self.layout_name = ""
         self.layout_description = ""
@@ -90,7 +96,7 @@ class SaveLayoutDialog(QDialog):
         
         # Buttons
         button_layout = QHBoxLayout()
-        button_layout.addStretch()
+        button_layout.setAlignment(Qt.AlignmentFlag.AlignRight)
         
         cancel_button = QPushButton("Cancel")
         cancel_button.setObjectName("cancel_button")
@@ -107,20 +113,29 @@ class SaveLayoutDialog(QDialog):
         # Set focus to name input
         self.name_input.setFocus()
         
+    def reset(self):
+        """Clears the fields so the dialog instance can be reused for the next save."""
+        self.layout_name = ""
+        self.layout_description = ""
+        self.desc_input.clear()
+        self.name_input.clear()
+        if self.name_input.property("error"):
+            self.name_input.setProperty("error", False)
+            style = self.name_input.style()
+            style.unpolish(self.name_input)
+            style.polish(self.name_input)
+            self.name_input.setPlaceholderText("Enter a name for your layout...")
+        self.name_input.setFocus()
+        
     def _on_save(self):
         """Handle save button click."""
         name = self.name_input.text().strip()
         if not name:
-            self.name_input.setStyleSheet("""
-                QLineEdit {
-                    background-color: #3c3c3c;
-                    border: 2px solid #dc3545;
-                    border-radius: 4px;
-                    padding: 6px;
-                    color: #ffffff;
-                    font-size: 11px;
-                }
-            """)
+            # Restyle through the shared stylesheet instead of parsing a new one
+            self.name_input.setProperty("error", True)
+            style = self.name_input.style()
+            style.unpolish(self.name_input)
+            style.polish(self.name_input)
             self.name_input.setPlaceholderText("Please enter a layout name!")
             return
             
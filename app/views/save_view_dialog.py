@@ -2,6 +2,53 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QLineEdit, QPushButton, QTextEdit, QRadioButton, QButtonGroup)
 from PyQt6.QtCore import Qt
 
+# Simple dark theme
+_DIALOG_QSS = """
+    QDialog {
+        background-color: #2b2b2b;
+        color: #ffffff;
+    }
+    QLabel {
+        color: #ffffff;
+        font-size: 12px;
+        font-weight: bold;
+    }
+    QLineEdit, QTextEdit {
+        background-color: #404040;
+        border: 1px solid #555555;
+        border-radius: 4px;
+        padding: 8px;
+        color: #ffffff;
+        font-size: 12px;
+    }
+    QLineEdit:focus, QTextEdit:focus {
+        border: 2px solid #0078d4;
+    }
+    QPushButton {
+        background-color: #0078d4;
+        color: white;
+        border: none;
+        padding: 10px 20px;
+        border-radius: 4px;
+        font-size: 12px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #106ebe;
+    }
+    QPushButton#cancel_button {
+        background-color: #666666;
+    }
+    QPushButton#cancel_button:hover {
+        background-color: #777777;
+    }
+    QRadioButton {
+        color: #ffffff;
+        font-size: 12px;
+    }
+"""
+
 class SaveViewDialog(QDialog):
     """Dialog for saving a custom view with a name and description."""
     
@@ -13,51 +60,7 @@ class SaveViewDialog(QDialog):
         self.setWindowFlags(Qt.WindowType.Dialog | Qt.WindowType.WindowCloseButtonHint)
         
         # Simple dark theme
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #2b2b2b;
-                color: #ffffff;
-            }
-            QLabel {
-                color: #ffffff;
-                font-size: 12px;
-                font-weight: bold;
-            }
-            QLineEdit, QTextEdit {
-                background-color: #404040;
-                border: 1px solid #555555;
-                border-radius: 4px;
-                padding: 8px;
-                color: #ffffff;
-                font-size: 12px;
-            }
-            QLineEdit:focus, QTextEdit:focus {
-                border: 2px solid #0078d4;
-            }
-            QPushButton {
-                background-color: #0078d4;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 4px;
-                font-size: 12px;
-                font-weight: bold;
-                min-width: 80px;
-            }
-            QPushButton:hover {
-                background-color: #106ebe;
-            }
-            QPushButton#cancel_button {
-                background-color: #666666;
-            }
-            QPushButton#cancel_button:hover {
-                background-color: #777777;
-            }
-            QRadioButton {
-                color: #ffffff;
-                font-size: 12px;
-            }
-        """)
+        self.setStyleSheet(_DIALOG_QSS)
         
         self.view_name = ""
         self.view_description = ""
@@ -124,7 +127,7 @@ class SaveViewDialog(QDialog):
         # Buttons
         button_layout = QHBoxLayout()
         button_layout.setSpacing(12)
-        button_layout.addStretch()
+        button_layout.setAlignment(Qt.AlignmentFlag.AlignRight)
         
         cancel_button = QPushButton("Cancel")
         cancel_button.setObjectName("cancel_button")
@@ -153,6 +156,16 @@ class SaveViewDialog(QDialog):
         else:
             self.save_button.setText("Save Layout")
     
+    def reset(self):
+        """Clears the fields so the dialog instance can be reused for the next save."""
+        self.view_name = ""
+        self.view_description = ""
+        self.save_type = "view"
+        self.view_radio.setChecked(True)
+        self.desc_input.clear()
+        self.name_input.clear()
+        self.name_input.setFocus()
+    
     def _on_save(self):
         """Handle save button click."""
         name = self.name_input.text().strip()
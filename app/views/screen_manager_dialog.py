@@ -1,8 +1,58 @@
 import sys
+from contextlib import contextmanager
+from functools import lru_cache
 from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QFrame,
-                             QPushButton, QScrollArea, QWidget, QGraphicsDropShadowEffect, QApplication)
-from PyQt6.QtCore import Qt, pyqtSignal, QMimeData
-from PyQt6.QtGui import QColor, QDrag, QPainter, QPen, QFont, QPixmap
+                             QPushButton, QScrollArea, QWidget, QApplication)
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QMimeData, QRect, QRectF
+from PyQt6.QtGui import QColor, QDrag, QImage, QPainter, QPen, QFont, QPixmap
+
+# Layout preview drawing style, built once instead of on every paint
+_PREVIEW_PEN = QPen(QColor("#00aaff"), 2)
+_PREVIEW_BRUSH = QColor("#3a3d41")
+_PREVIEW_TEXT = QColor(Qt.GlobalColor.white)
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+
+# Drop zone highlight while a page is dragged over it, painted directly
+_DRAGOVER_PEN = QPen(QColor("#33ccff"), 2)
+_DRAGOVER_BRUSH = QColor("#004488")
+
+# Alpha mask (70% opaque) applied to the page label snapshot shown while dragging
+_DRAG_ALPHA = QColor(0, 0, 0, 178)
+
+@lru_cache(maxsize=None)
+def _shadow_pixmap(spread, alpha):
+    """
+    Soft rounded shadow tile, rendered once per (spread, alpha) and stretched
+    as a nine-slice. Stacked translucent rounded rects approximate the blur
+    that QGraphicsDropShadowEffect would recompute on every paint.
+    """
+    size = 2 * spread + 1
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setPen(Qt.PenStyle.NoPen)
+    painter.setBrush(QColor(0, 0, 0, max(1, alpha // spread)))
+    for inset in range(spread):
+        radius = spread - inset
+        painter.drawRoundedRect(QRectF(inset, inset, size - 2 * inset, size - 2 * inset), radius, radius)
+    painter.end()
+    return pixmap
+
+def _draw_shadow(painter, rect, spread, alpha):
+    """Draws the cached shadow tile into rect, keeping its corners unscaled."""
+    tile = _shadow_pixmap(spread, alpha)
+    end = tile.width()
+    xs = (rect.left(), rect.left() + spread, rect.right() + 1 - spread, rect.right() + 1)
+    ys = (rect.top(), rect.top() + spread, rect.bottom() + 1 - spread, rect.bottom() + 1)
+    src = (0, spread, end - spread, end)
+    for col in range(3):
+        for row in range(3):
+            painter.drawPixmap(
+                QRect(xs[col], ys[row], xs[col + 1] - xs[col], ys[row + 1] - ys[row]),
+                tile,
+                QRect(src[col], src[row], src[col + 1] - src[col], src[row + 1] - src[row]),
+            )
 
 # --- REFINED STYLESHEET FOR CLARITY AND DEPTH ---
 STYLESHEET = """
@@ -76,14 +126,18 @@ DraggablePageLabel, DropZoneWidget {
     font-size: 12px;
     padding: 8px;
 }
+DraggablePageLabel {
+    /* Room for the pre-rendered drop shadow painted around the box */
+    margin: 2px 6px 6px 2px;
+}
 DropZoneWidget[assigned="true"] {
     background-color: #003366;
     border: 2px solid #00aaff;
     color: white;
 }
-DropZoneWidget[dragover="true"] {
-    background-color: #004488;
-    border: 2px solid #33ccff;
+QLabel[placeholder="true"] {
+    font-style: italic;
+    color: #777;
 }
 LayoutPreviewWidget {
     background-color: #2a2d31;
@@ -110,29 +164,41 @@ class DraggablePageLabel(QLabel):
         super().__init__(page_id, parent)
 
         self.page_id = page_id
+        self._press_pos = None
         self.setMinimumHeight(60)
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setWordWrap(True)
-        
-        shadow = QGraphicsDropShadowEffect(self)
-        shadow.setBlurRadius(15)
-        shadow.setColor(QColor(0, 0, 0, 150))
-        shadow.setOffset(2, 2)
-        self.setGraphicsEffect(shadow)
+
+    def paintEvent(self, event):
+        # Shared pre-rendered shadow under the styled box (offset 2,2 inside the QSS margin)
+        painter = QPainter(self)
+        _draw_shadow(painter, self.rect(), 8, 150)
+        painter.end()
+        super().paintEvent(event)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._press_pos = event.position().toPoint()
+        super().mousePressEvent(event)
 
     def mouseMoveEvent(self, event):
-        if event.buttons() != Qt.MouseButton.LeftButton:
+        if event.buttons() != Qt.MouseButton.LeftButton or self._press_pos is None:
             return
+        # Only start the drag (and build its pixmap) once the pointer really moved
+        if (event.position().toPoint() - self._press_pos).manhattanLength() < QApplication.startDragDistance():
+            return
+        self._press_pos = None
         
         mime_data = QMimeData()
         mime_data.setText(self.page_id)
         
-        pixmap = QPixmap(self.size())
-        pixmap.fill(Qt.GlobalColor.transparent)
-        painter = QPainter(pixmap)
-        painter.setOpacity(0.7)
-        painter.drawPixmap(self.rect(), self.grab())
+        # Fade the snapshot in place (one alpha pass) instead of repainting it into a second pixmap
+        image = self.grab().toImage().convertToFormat(QImage.Format.Format_ARGB32_Premultiplied)
+        painter = QPainter(image)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_DestinationIn)
+        painter.fillRect(image.rect(), _DRAG_ALPHA)
         painter.end()
+        pixmap = QPixmap.fromImage(image)
 
         drag = QDrag(self)
         drag.setMimeData(mime_data)
@@ -158,7 +224,7 @@ class DropZoneWidget(QFrame):
         self.slot_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.page_label = QLabel("(Drop Page Here)")
         self.page_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.page_label.setStyleSheet("font-style: italic; color: #777;")
+        self.page_label.setProperty("placeholder", True)
         self.page_label.setWordWrap(True)
         self.page_label.setMinimumHeight(40)
 
@@ -166,27 +232,55 @@ class DropZoneWidget(QFrame):
         self.main_layout.addWidget(self.page_label)
 
         self.setProperty("assigned", False)
-        self.setProperty("dragover", False)
+        self._dragover = False
+
+    def reset(self, slot_id):
+        """Re-targets a pooled drop zone at another slot, clearing any assignment."""
+        self.slot_id = slot_id
+        self.assigned_page_id = None
+        self._set_dragover(False)
+        self.slot_label.setText(f"Slot: {slot_id}")
+        self.page_label.setText("(Drop Page Here)")
+        if not self.page_label.property("placeholder"):
+            self.page_label.setProperty("placeholder", True)
+            self.style().polish(self.page_label)
+        if self.property("assigned"):
+            self.setProperty("assigned", False)
+            self.style().polish(self)
+
+    def _set_dragover(self, state):
+        """Toggles the drag highlight; it is painted, so no stylesheet repolish is needed."""
+        if self._dragover != state:
+            self._dragover = state
+            self.update()
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if self._dragover:
+            painter = QPainter(self)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(_DRAGOVER_PEN)
+            painter.setBrush(_DRAGOVER_BRUSH)
+            painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), 8, 8)
 
     def dragEnterEvent(self, event):
         if event.mimeData().hasText():
             event.acceptProposedAction()
-            self.setProperty("dragover", True)
-            self.style().polish(self)
+            self._set_dragover(True)
 
     def dragLeaveEvent(self, event):
-        self.setProperty("dragover", False)
-        self.style().polish(self)
+        self._set_dragover(False)
 
     def dropEvent(self, event):
         page_id = event.mimeData().text()
         self.assigned_page_id = page_id
         
         self.page_label.setText(page_id)
-        self.page_label.setStyleSheet("")
+        self.page_label.setProperty("placeholder", False)
+        self.style().polish(self.page_label)
         
+        self._set_dragover(False)
         self.setProperty("assigned", True)
-        self.setProperty("dragover", False)
         self.style().polish(self)
         
         self.pageDropped.emit(self.slot_id, self.assigned_page_id)
@@ -204,37 +298,56 @@ class LayoutPreviewWidget(QFrame):
         self.setMaximumHeight(200)
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setProperty("selected", False)
+        
+        # Per-slot (rect, slot id, label fits) tuples for the current widget size
+        self._cached_size = None
+        self._cached_slots = []
+        # Pre-rendered slot drawing, blitted over the styled frame on each paint
+        self._pixmap_cache = None
+        self._pixmap_key = None
 
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 5, 5, 5)
-        label = QLabel(layout_name)
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setWordWrap(True)
-        label.setMaximumHeight(25)
-        layout.addWidget(label)
+        self.name_label = QLabel(layout_name)
+        self.name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.name_label.setWordWrap(True)
+        self.name_label.setMaximumHeight(25)
+        layout.addWidget(self.name_label)
         layout.addStretch()
 
+    def reconfigure(self, layout_name, slots_data):
+        """Shows another layout in a pooled preview, dropping the cached drawing."""
+        self.layout_name = layout_name
+        self.slots_data = slots_data
+        self.name_label.setText(layout_name)
+        self._cached_size = None
+        self._pixmap_cache = None
+        self.set_selected(False)
+        self.update()
+
     def set_selected(self, is_selected):
-        self.setProperty("selected", is_selected)
-        self.style().polish(self)
+        if self.property("selected") != is_selected:
+            self.setProperty("selected", is_selected)
+            self.style().polish(self)
 
     def mousePressEvent(self, event):
         self.selected.emit(self.layout_name)
 
-    def paintEvent(self, event):
-        super().paintEvent(event)
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    def resizeEvent(self, event):
+        self._cached_size = None
+        self._pixmap_cache = None
+        super().resizeEvent(event)
+
+    def _slot_rects(self):
+        """Returns the cached slot rectangles, recomputing them after a resize."""
+        size = self.size()
+        if size == self._cached_size:
+            return self._cached_slots
         
         # Define the area where we'll draw the preview (leave space for the label)
         preview_area = self.rect().adjusted(10, 30, -10, -10)
-        
-        # Set up drawing style
-        pen = QPen(QColor("#00aaff"), 2)
-        painter.setPen(pen)
-        painter.setBrush(QColor("#3a3d41"))
-        
-        # Draw each slot as a rectangle
+        metrics = self.fontMetrics()
+        slots = []
         for slot in self.slots_data:
             geo = slot['geometry']
             # Use normalized coordinates (0.0 to 1.0) directly
@@ -242,20 +355,59 @@ class LayoutPreviewWidget(QFrame):
             y = preview_area.y() + (geo['y'] * preview_area.height())
             w = geo['width'] * preview_area.width()
             h = geo['height'] * preview_area.height()
+            rect = QRect(int(x), int(y), int(w), int(h))
             
-            # Draw the rectangle
-            painter.drawRect(int(x), int(y), int(w), int(h))
-            
-            # Draw slot ID text in the center of each rectangle
-            text_rect = painter.boundingRect(int(x), int(y), int(w), int(h), Qt.AlignmentFlag.AlignCenter, slot['id'])
-            if text_rect.width() < w and text_rect.height() < h:
-                painter.setPen(QColor("#ffffff"))
-                painter.drawText(int(x), int(y), int(w), int(h), Qt.AlignmentFlag.AlignCenter, slot['id'])
-                painter.setPen(pen)
+            # The slot ID is only drawn when it fits inside its rectangle
+            text_rect = metrics.boundingRect(rect, _ALIGN_CENTER, slot['id'])
+            fits = text_rect.width() < w and text_rect.height() < h
+            slots.append((rect, slot['id'], fits))
+        
+        self._cached_size = size
+        self._cached_slots = slots
+        return slots
+
+    def _slots_pixmap(self):
+        """Returns the slot drawing rendered into a transparent pixmap, cached per size and DPR."""
+        dpr = self.devicePixelRatioF()
+        key = (self.size(), dpr)
+        if self._pixmap_cache is not None and key == self._pixmap_key:
+            return self._pixmap_cache
+        
+        pixmap = QPixmap(round(self.width() * dpr), round(self.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.GlobalColor.transparent)
+        
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font())
+        
+        # Set up drawing style
+        painter.setPen(_PREVIEW_PEN)
+        painter.setBrush(_PREVIEW_BRUSH)
+        
+        # All slot rectangles in one call, then each ID centered where it fits
+        slots = self._slot_rects()
+        painter.drawRects([rect for rect, _slot_id, _fits in slots])
+        painter.setPen(_PREVIEW_TEXT)
+        for rect, slot_id, fits in slots:
+            if fits:
+                painter.drawText(rect, _ALIGN_CENTER, slot_id)
+        painter.end()
+        
+        self._pixmap_cache = pixmap
+        self._pixmap_key = key
+        return pixmap
+
+    def paintEvent(self, event):
+        # The frame (hover/selected states) is drawn by the stylesheet; the slots come from the cache
+        super().paintEvent(event)
+        QPainter(self).drawPixmap(0, 0, self._slots_pixmap())
 
 class ScreenManagerDialog(QDialog):
     layoutApplied = pyqtSignal(str, dict)
 
+    _SHADOW_SPREAD = 24  # Fits inside the 40px margins around main_frame
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Screen Layout Manager")
@@ -274,14 +426,11 @@ class ScreenManagerDialog(QDialog):
 
         # --- DROP SHADOW FOR DEPTH ---
         # This is now the primary effect for separating the dialog from the background.
-        self.shadow = QGraphicsDropShadowEffect(self)
-        self.shadow.setBlurRadius(50) # Increased blur radius for a softer, more prominent shadow
-        self.shadow.setColor(QColor(0, 0, 0, 200)) # Darker shadow
-        self.shadow.setOffset(0, 0)
+        # It is painted around the main frame from a cached tile (see paintEvent)
+        # rather than blurred live by a QGraphicsDropShadowEffect.
 
-        # The main frame holds all content. The shadow is applied to it.
+        # The main frame holds all content. The shadow is painted around it.
         self.main_frame = QFrame(self, objectName="main_frame")
-        self.main_frame.setGraphicsEffect(self.shadow)
         
         # This layout centers the main_frame, providing margin for the shadow to appear.
         self.super_layout = QVBoxLayout(self)
@@ -296,6 +445,9 @@ class ScreenManagerDialog(QDialog):
         self._current_assignments = {}
         self._selected_layout_name = None
         self._layout_widgets = {}
+        # Preview and drop zone widgets are kept and re-targeted rather than rebuilt
+        self._preview_pool = []
+        self._dropzone_pool = []
 
         # --- Main Layout (inside the main_frame) ---
         self.main_layout = QVBoxLayout(self.main_frame)
@@ -311,9 +463,10 @@ class ScreenManagerDialog(QDialog):
         self.main_layout.addLayout(content_layout, stretch=1)
 
         # --- Left, Middle, Right Panels ---
-        self.layouts_container = self._create_panel("1. Select Layout")
-        self.pages_container = self._create_panel("2. Available Pages")
-        self.slots_container = self._create_panel("3. Assign to Slots")
+        # Each panel's item layout is kept so refreshes don't have to look it up
+        self.layouts_container, self.layouts_layout = self._create_panel("1. Select Layout")
+        self.pages_container, self.pages_layout = self._create_panel("2. Available Pages")
+        self.slots_container, self.slots_layout = self._create_panel("3. Assign to Slots")
         content_layout.addWidget(self.layouts_container, stretch=3)
         content_layout.addWidget(self.pages_container, stretch=2)
         content_layout.addWidget(self.slots_container, stretch=3)
@@ -333,6 +486,11 @@ class ScreenManagerDialog(QDialog):
         cancel_button.clicked.connect(self.reject)
         apply_button.clicked.connect(self.on_accept)
 
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        spread = self._SHADOW_SPREAD
+        _draw_shadow(painter, self.main_frame.geometry().adjusted(-spread, -spread, spread, spread), spread, 200)
+
     # All helper methods (_create_panel, load_data, _clear_layout_container, etc.)
     # remain the same as the previous version. I am including them for completeness.
 
@@ -345,14 +503,14 @@ class ScreenManagerDialog(QDialog):
         scroll_area.setWidgetResizable(True)
         
         container_widget = QWidget()
-        self.container_layout = QVBoxLayout(container_widget)
-        self.container_layout.setSpacing(10)
-        self.container_layout.addStretch()
+        container_layout = QVBoxLayout(container_widget)
+        container_layout.setSpacing(10)
+        container_layout.addStretch()
         
         scroll_area.setWidget(container_widget)
         panel_layout.addWidget(scroll_area)
         
-        return panel_frame
+        return panel_frame, container_layout
 
     def load_data(self, layouts_data, pages_data):
         self._layouts_data = layouts_data
@@ -363,51 +521,84 @@ class ScreenManagerDialog(QDialog):
             first_layout_name = list(layouts_data.keys())[0]
             self.on_layout_selected(first_layout_name)
 
-    def _clear_layout_container(self, panel):
-        scroll_area = panel.findChild(QScrollArea)
-        container_widget = scroll_area.widget()
-        layout = container_widget.layout()
+    @contextmanager
+    def _batched(self, layout):
+        """Suspends painting and geometry updates of a panel while its items change."""
+        container = layout.parentWidget()
+        container.setUpdatesEnabled(False)
+        layout.setEnabled(False)
+        try:
+            yield layout
+        finally:
+            # One relayout and one repaint for the whole batch
+            layout.setEnabled(True)
+            layout.activate()
+            container.setUpdatesEnabled(True)
+
+    def _clear_layout_container(self, layout):
+        # Callers run this inside _batched(), so removed widgets never repaint
         while layout.count() > 1:
-            child = layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
+            widget = layout.takeAt(0).widget()
+            if widget is not None:
+                widget.hide()
+                widget.deleteLater()
 
     def _populate_layouts(self):
-        self._clear_layout_container(self.layouts_container)
+        pool = self._preview_pool
         self._layout_widgets = {}
-        layout = self.layouts_container.findChild(QScrollArea).widget().layout()
-        for name, data in self._layouts_data.items():
-            preview = LayoutPreviewWidget(name, data.get("slots", []))
-            preview.selected.connect(self.on_layout_selected)
-            layout.insertWidget(layout.count() - 1, preview)
-            self._layout_widgets[name] = preview
+        with self._batched(self.layouts_layout) as layout:
+            for index, (name, data) in enumerate(self._layouts_data.items()):
+                if index < len(pool):
+                    preview = pool[index]
+                    preview.reconfigure(name, data.get("slots", []))
+                    preview.show()
+                else:
+                    preview = LayoutPreviewWidget(name, data.get("slots", []))
+                    preview.selected.connect(self.on_layout_selected)
+                    layout.insertWidget(layout.count() - 1, preview)
+                    pool.append(preview)
+                self._layout_widgets[name] = preview
+            # Surplus previews stay pooled; hidden widgets take no room in the layout
+            for preview in pool[len(self._layout_widgets):]:
+                preview.hide()
             
     def _populate_pages(self):
-        self._clear_layout_container(self.pages_container)
-        layout = self.pages_container.findChild(QScrollArea).widget().layout()
-        for page in self._pages_data:
-            page_label = DraggablePageLabel(page["id"])
-            layout.insertWidget(layout.count() - 1, page_label)
+        with self._batched(self.pages_layout) as layout:
+            self._clear_layout_container(layout)
+            for page in self._pages_data:
+                page_label = DraggablePageLabel(page["id"])
+                layout.insertWidget(layout.count() - 1, page_label)
 
+    @pyqtSlot(str)
     def on_layout_selected(self, layout_name):
         self._selected_layout_name = layout_name
         self._current_assignments = {}
-        self._clear_layout_container(self.slots_container)
 
         for name, widget in self._layout_widgets.items():
             widget.set_selected(name == layout_name)
         
-        layout = self.slots_container.findChild(QScrollArea).widget().layout()
-        layout_data = self._layouts_data.get(layout_name, {})
-        for slot in layout_data.get("slots", []):
-            slot_id = slot["id"]
-            drop_zone = DropZoneWidget(slot_id)
-            drop_zone.pageDropped.connect(self.on_page_assigned)
-            layout.insertWidget(layout.count() - 1, drop_zone)
-
+        pool = self._dropzone_pool
+        slots = self._layouts_data.get(layout_name, {}).get("slots", [])
+        with self._batched(self.slots_layout) as layout:
+            for index, slot in enumerate(slots):
+                slot_id = slot["id"]
+                if index < len(pool):
+                    drop_zone = pool[index]
+                    drop_zone.reset(slot_id)
+                    drop_zone.show()
+                else:
+                    drop_zone = DropZoneWidget(slot_id)
+                    drop_zone.pageDropped.connect(self.on_page_assigned)
+                    layout.insertWidget(layout.count() - 1, drop_zone)
+                    pool.append(drop_zone)
+            for drop_zone in pool[len(slots):]:
+                drop_zone.hide()
+
+    @pyqtSlot(str, str)
     def on_page_assigned(self, slot_id, page_id):
         self._current_assignments[slot_id] = page_id
         
+    @pyqtSlot()
     def on_accept(self):
         if self._selected_layout_name:
             self.layoutApplied.emit(self._selected_layout_name, self._current_assignments)
@@ -1,3 +1,5 @@
+from functools import partial
+
 from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QVBoxLayout, QPushButton, 
                              QLabel, QFrame, QApplication)
 from PyQt6.QtCore import Qt, pyqtSignal
@@ -11,6 +13,49 @@ class ViewSelectorBar(QWidget):
     """
     view_selected = pyqtSignal(str)  # Emits view_id when a view is selected
     
+    # Whole-bar stylesheet, parsed once; children are matched by object name
+    _BAR_QSS = """
+        QWidget {
+            background: transparent;
+        }
+        QFrame#bar_frame, QLabel#selector_title, QLabel#no_views_label {
+            /* QLabel is a QFrame, so the labels carry the bar's frame look too */
+            background-color: #2b2b2b;
+            border: 2px solid #404040;
+            border-radius: 12px;
+        }
+        QLabel#selector_title {
+            color: #ffffff;
+            font-size: 24px;
+            font-weight: bold;
+            margin-bottom: 10px;
+        }
+        QLabel#no_views_label {
+            color: #888888;
+            font-style: italic;
+            padding: 5px;
+        }
+        QPushButton#view_button {
+            background-color: #404040;
+            color: #ffffff;
+            border: 2px solid #505050;
+            border-radius: 10px;
+            padding: 15px 30px;
+            font-size: 16px;
+            font-weight: bold;
+            min-width: 150px;
+            min-height: 50px;
+        }
+        QPushButton#view_button:hover {
+            background-color: #505050;
+            border-color: #606060;
+        }
+        QPushButton#view_button:pressed {
+            background-color: #606060;
+            border-color: #707070;
+        }
+    """
+    
     def __init__(self, view_manager):
         super().__init__()
         self._view_manager = view_manager
@@ -44,13 +89,7 @@ class ViewSelectorBar(QWidget):
         
         # Create the bar container
         bar_frame = QFrame()
-        bar_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2b2b2b;
-                border: 2px solid #404040;
-                border-radius: 12px;
-            }
-        """)
+        bar_frame.setObjectName("bar_frame")
         
         # Bar layout
         bar_layout = QVBoxLayout(bar_frame)
@@ -60,14 +99,7 @@ class ViewSelectorBar(QWidget):
         # Title label - bigger for 1920x1080
         title_label = QLabel("Select View")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 24px;
-                font-weight: bold;
-                margin-bottom: 10px;
-            }
-        """)
+        title_label.setObjectName("selector_title")
         bar_layout.addWidget(title_label)
         
         # Buttons container
@@ -80,11 +112,7 @@ class ViewSelectorBar(QWidget):
         self.setLayout(main_layout)
         
         # Apply window styling
-        self.setStyleSheet("""
-            QWidget {
-                background: transparent;
-            }
-        """)
+        self.setStyleSheet(self._BAR_QSS)
         
     def _load_views(self):
         """Load available views and create buttons for them."""
@@ -93,13 +121,7 @@ class ViewSelectorBar(QWidget):
         if not views:
             # Show a message if no views available
             no_views_label = QLabel("No views available")
-            no_views_label.setStyleSheet("""
-                QLabel {
-                    color: #888888;
-                    font-style: italic;
-                    padding: 5px;
-                }
-            """)
+            no_views_label.setObjectName("no_views_label")
             self._buttons_layout.addWidget(no_views_label)
             return
             
@@ -118,36 +140,15 @@ class ViewSelectorBar(QWidget):
         button.setText(view_name)
         button.setToolTip(view_description)
         
-        # Style the button - bigger for 1920x1080 resolution
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: #404040;
-                color: #ffffff;
-                border: 2px solid #505050;
-                border-radius: 10px;
-                padding: 15px 30px;
-                font-size: 16px;
-                font-weight: bold;
-                min-width: 150px;
-                min-height: 50px;
-            }
-            QPushButton:hover {
-                background-color: #505050;
-                border-color: #606060;
-                transform: scale(1.05);
-            }
-            QPushButton:pressed {
-                background-color: #606060;
-                border-color: #707070;
-            }
-        """)
+        # Styled by the bar's stylesheet - bigger for 1920x1080 resolution
+        button.setObjectName("view_button")
         
         # Connect button click to view selection
-        button.clicked.connect(lambda checked, vid=view_id: self._on_view_selected(vid))
+        button.clicked.connect(partial(self._on_view_selected, view_id))
         
         return button
         
-    def _on_view_selected(self, view_id):
+    def _on_view_selected(self, view_id, _checked=False):
         """Handle view selection."""
         print(f"View selected: {view_id}")
         self.view_selected.emit(view_id)
@@ -1,13 +1,21 @@
 import sys
 import os # <-- IMPORT THE 'os' MODULE
 import json
+import logging
 
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtNetwork import QNetworkProxyFactory
 from PyQt6.QtCore import Qt
 from app.controllers.application_controller import ApplicationController
+from app.core.webengine_flags import CHROME_FLAGS_STR
 
 if __name__ == "__main__":
+    # Verbose diagnostics only when APP_DEBUG is set
+    logging.basicConfig(
+        level=logging.DEBUG if os.environ.get("APP_DEBUG") else logging.INFO,
+        format="%(asctime)s %(levelname)s [%(name)s] %(message)s",
+    )
+
     # --- DISABLE HiDPI SCALING TO PREVENT ZOOM ISSUES ---
     # Comment out high DPI scaling to fix zoom issues
     # QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
@@ -21,34 +29,9 @@ if __name__ == "__main__":
 
     os.environ["QTWEBENGINE_REMOTE_DEBUGGING"] = "9222"
 
-    # Allow Windows Integrated Authentication for Power BI and corporate domains
-    chrome_flags = [
-        "--auth-server-allowlist=*.ocpgroup.ma,*.powerbi.com,*.microsoftonline.com,*.windows.net,*.sharepoint.com",
-        "--auth-negotiate-delegate-whitelist=*.ocpgroup.ma,*.powerbi.com,*.microsoftonline.com,*.windows.net,*.sharepoint.com",
-        "--auth-schemes=basic,digest,ntlm,negotiate",
-        # Proxy auto-detection for corporate environments
-        "--proxy-auto-detect",
-        # Allow popups for auth flows
-        "--disable-popup-blocking",
-        # Performance flags for heavy dashboards like Power BI
-        "--ignore-gpu-blocklist",
-        "--enable-gpu-rasterization",
-        "--enable-zero-copy",
-        "--enable-accelerated-2d-canvas",
-        "--js-flags=--max-old-space-size=4096",
-        "--disable-background-timer-throttling",
-        "--disable-backgrounding-occluded-windows",
-        "--disable-renderer-backgrounding",
-        # Relax cookie restrictions to help Microsoft auth flows
-        "--disable-features=SameSiteByDefaultCookies,CookiesWithoutSameSiteMustBeSecure,ThirdPartyStoragePartitioning",
-        # Additional compatibility
-        "--enable-features=NetworkService,OutOfBlinkCors",
-    ]
-    # If an explicit proxy server is defined, prefer it
-    
+    # Chromium flags (auth allowlists, proxy, GPU/perf) live in app/core/webengine_flags.py
     existing = os.environ.get("QTWEBENGINE_CHROMIUM_FLAGS", "").strip()
-    combo = (existing + " " + " ".join(chrome_flags)).strip()
-    os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = combo
+    os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = (existing + " " + CHROME_FLAGS_STR).strip()
 
     app = QApplication(sys.argv)
     # Ensure Qt uses system proxy settings as a baseline
@@ -68,8 +51,8 @@ if __name__ == "__main__":
     def cleanup_on_exit():
         print("App closing - ensuring session data is saved...")
         try:
-            from app.core.profile_manager import WebProfileManager
-            profile_manager = WebProfileManager()
+            from app.core.profile_manager import get_profile_manager
+            profile_manager = get_profile_manager()
             profile_manager.ensure_session_persistence()
             print("Profile info:", profile_manager.get_profile_info())
         except Exception as e: